@@ -7,18 +7,31 @@ Status updates are emitted to stderr as: STATUS:{"step":"...","message":"..."}
 """
 
 import argparse
-import io
+import contextlib
+import hashlib
 import importlib.util
 import json
+import mmap
 import os
+import pickletools
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import traceback
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8")
@@ -37,23 +50,366 @@ DATA_FILE_URLS = {
     "digital_khatt_v2_script.json": "https://media.githubusercontent.com/media/zonetecde/QuranCaption/main/src-tauri/python/quran-multi-aligner/data/digital_khatt_v2_script.json",
     "phoneme_sub_costs.json": "https://raw.githubusercontent.com/zonetecde/QuranCaption/main/src-tauri/python/quran-multi-aligner/data/phoneme_sub_costs.json",
 }
+# Expected SHA-256 of each data file (the Git LFS oid for LFS-tracked files).
+DATA_FILE_SHA256 = {
+    "phoneme_cache.pkl": "027283ab3be8a239b99ba4b3ffeb869efddc3da6fce12e02473d3e335dbf3a04",
+    "phoneme_ngram_index_5.pkl": "b522664de41f590fc18fad385f023cb1a85829623cbcf035fe18152be52bc739",
+    "qpc_hafs.json": "9b2f91a19769275d0da57464002beacd8cec396b02b520aa14d17e3b135012a7",
+    "surah_info.json": "3636ee85446bc804a06a27bb4dc9752f36b45f476f9c1ca2661634d3ca87b9d4",
+    "digital_khatt_v2_script.json": "fd396239908253a07dc530580fd978c515cbac1b7751b2680296580fb62b247c",
+    "phoneme_sub_costs.json": "6378eac4de275a8e4efce72b3083756ecf2db1eb380eb98dfda231389e586868",
+}
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_WORKERS = 4
+VALIDATION_WORKERS = 4
+HF_ACCESS_CACHE_TTL_SECONDS = 6 * 3600
+HF_WARM_FLAG_TTL_SECONDS = 7 * 24 * 3600
+SEGMENTER_REPO = "obadx/recitation-segmenter-v2"
+PHONEME_ASR_REPOS = {"Base": "hetchyy/r15_95m", "Large": "hetchyy/r7"}
+
+_HTTP = None
+
+
+def get_http_pool():
+    """Return the shared keep-alive connection pool used for data downloads."""
+    global _HTTP
+    if _HTTP is None:
+        import urllib3
+
+        _HTTP = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=8,
+            retries=urllib3.Retry(3, backoff_factor=0.3),
+        )
+    return _HTTP
+
+
+def sidecar_path(file_path: Path, suffix: str) -> Path:
+    """Return a sibling path that keeps the original suffix, e.g. foo.pkl.etag."""
+    return file_path.with_suffix(file_path.suffix + suffix)
+
+
+def read_head(fd: int, size: int) -> bytes:
+    """Read the first *size* bytes of an open file without a Python file object."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, 0)
+    # Windows has no pread
+    os.lseek(fd, 0, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def open_with_head(file_path: Path, size: int) -> tuple[int, bytes]:
+    """Open a data file and return (fd, head); the caller owns the descriptor."""
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return fd, read_head(fd, size)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def parse_json_fd(fd: int) -> None:
+    """Parse the JSON document behind *fd*; orjson reads it straight from an mmap when available."""
+    advise_sequential(fd)
+    if orjson is not None:
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+        if mapped is not None:
+            with mapped, memoryview(mapped) as view:
+                orjson.loads(view)
+            return
+    os.lseek(fd, 0, os.SEEK_SET)
+    with os.fdopen(fd, "rb", closefd=False) as f:
+        json.load(f)
+
+
+def advise_sequential(fd: int) -> None:
+    """Hint the kernel to read ahead aggressively; no-op where posix_fadvise is unavailable (Windows)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def prefetch_data_files(paths) -> None:
+    """Warm the page cache for *paths* on a daemon thread so later loads overlap with model setup."""
+
+    def prefetch() -> None:
+        """Read-ahead each path in turn, skipping files that are missing or unreadable."""
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except OSError:
+                continue
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    # Windows: no readahead hint, so pull the file through the cache ourselves
+                    while os.read(fd, 4 << 20):
+                        pass
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    threading.Thread(target=prefetch, name="data-prefetch", daemon=True).start()
+
+
+def sha256_file(file_path: Path) -> str:
+    """Hex SHA-256 of a file, read in DOWNLOAD_CHUNK_SIZE chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        advise_sequential(f.fileno())
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def validated_marker(file_path: Path) -> Path:
+    """Return the marker path recording the last successful validation of a data file."""
+    return sidecar_path(file_path, ".ok")
+
+
+def file_signature(file_path: Path) -> str:
+    """Return "size:mtime_ns" for a data file, the key stored in its validation marker."""
+    st = os.stat(file_path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def data_set_signature(data_dir: Path, file_names) -> Optional[str]:
+    """Digest of (name, size, mtime_ns) for every required data file; None if any is missing."""
+    parts = []
+    for file_name in file_names:
+        try:
+            st = os.stat(data_dir / file_name)
+        except OSError:
+            return None
+        parts.append(f"{file_name}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    return hashlib.blake2b(b"|".join(parts), digest_size=16).hexdigest()
+
+
+def is_marked_valid(file_path: Path) -> bool:
+    """True when the data file is unchanged since it last passed validation."""
+    try:
+        marker = validated_marker(file_path).read_text(encoding="utf-8").strip()
+        return marker == file_signature(file_path)
+    except OSError:
+        return False
+
+
+def mark_valid(file_path: Path) -> None:
+    """Record that the data file passed validation; best effort on read-only installs."""
+    try:
+        validated_marker(file_path).write_text(file_signature(file_path), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def check_pickle_head(head: bytes) -> Optional[str]:
+    """Reject files whose first byte is not the binary pickle PROTO opcode."""
+    if not head or head[0] != 0x80:
+        return "invalid pickle header, expected a binary pickle file"
+    return None
+
+
+def check_pickle_body(fd: int) -> Optional[str]:
+    """Walk the pickle opcode stream without executing it, catching truncation/corruption."""
+    advise_sequential(fd)
+    os.lseek(fd, 0, os.SEEK_SET)
+    try:
+        with os.fdopen(fd, "rb", closefd=False) as f:
+            for _opcode, _arg, _pos in pickletools.genops(f):
+                pass
+        return None
+    except Exception as error:
+        return f"corrupt pickle ({type(error).__name__}: {error})"
+
+
+def check_json_head(head: bytes) -> Optional[str]:
+    """Reject files that do not start with a JSON object or array."""
+    if not head.strip().startswith((b"{", b"[")):
+        return "invalid JSON header, expected a JSON file"
+    return None
+
+
+def check_json_body(fd: int) -> Optional[str]:
+    """Parse the whole document, catching truncation/corruption."""
+    try:
+        parse_json_fd(fd)
+        return None
+    except ValueError as error:
+        return f"invalid JSON ({error})"
+
+
+# Required data files and how to check each: (name, header check, full check).
+DATA_FILE_SPECS = (
+    ("phoneme_cache.pkl", check_pickle_head, check_pickle_body),
+    ("phoneme_ngram_index_5.pkl", check_pickle_head, check_pickle_body),
+    ("qpc_hafs.json", check_json_head, check_json_body),
+    ("surah_info.json", check_json_head, check_json_body),
+    ("digital_khatt_v2_script.json", check_json_head, check_json_body),
+    ("phoneme_sub_costs.json", check_json_head, check_json_body),
+)
+
+
+def inspect_data_file(file_path: Path, check_head, check_body) -> Optional[str]:
+    """Open the file once: peek its header, then run the full structural check on the same fd."""
+    fd, head = open_with_head(file_path, 256)
+    try:
+        if head.startswith(LFS_POINTER_PREFIX):
+            return "file is a Git LFS pointer, not real content"
+        return check_head(head) or check_body(fd)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def silence_output(verbose: bool):
+    """Point fds 1/2 at devnull for the duration so library noise never reaches the JSON stdout.
+
+    sys.stdout/sys.stderr stay bound to their real streams: they write through
+    the same fds, so nothing is buffered in memory while models load.
+    """
+    if verbose:
+        yield
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    saved_fds = (os.dup(1), os.dup(2))
+    os.dup2(devnull_fd, 1)
+    os.dup2(devnull_fd, 2)
+    try:
+        yield
+    finally:
+        # Drain anything still buffered into devnull before restoring the real fds
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        for fd in (*saved_fds, devnull_fd):
+            os.close(fd)
 
 
 def emit_status(original_stderr, step: str, message: str) -> None:
+    """Write one STATUS line to the saved (binary, buffered) stderr."""
+    if orjson is not None:
+        payload = orjson.dumps({"step": step, "message": message})
+    else:
+        payload = json.dumps({"step": step, "message": message}, ensure_ascii=False).encode("utf-8")
     try:
-        payload = json.dumps({"step": step, "message": message}, ensure_ascii=False)
-        original_stderr.write(f"STATUS:{payload}\n")
+        # Single write + flush per line keeps the framing the app parses.
+        original_stderr.write(b"STATUS:" + payload + b"\n")
         original_stderr.flush()
-    except Exception:
+    except (OSError, ValueError):
+        # The app closed the pipe or the stream is already closed; status is best-effort.
         pass
 
 
-def load_audio(audio_path: str):
-    import librosa
+def app_cache_dir() -> Path:
+    """Per-user cache directory that persists across wrapper invocations."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or (Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")
+    return Path(base) / "QuranCaption"
+
+
+def configure_cache_env() -> None:
+    """Point on-disk caches of the heavy dependencies at a stable location before they are imported."""
+    # librosa's numba kernels use cache=True; keep the compiled code out of the
+    # (possibly read-only) install dir so it survives across runs.
+    os.environ.setdefault("NUMBA_CACHE_DIR", str(app_cache_dir() / "numba"))
+    # torch.compile: reuse Inductor FX graphs and Triton kernels across runs.
+    os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(app_cache_dir() / "inductor"))
+    os.environ.setdefault("TRITON_CACHE_DIR", str(app_cache_dir() / "triton"))
+
+
+def hf_hub_cache_dir() -> Path:
+    """Resolve the huggingface_hub cache the same way the library does, without importing it."""
+    if os.environ.get("HF_HUB_CACHE"):
+        return Path(os.environ["HF_HUB_CACHE"])
+    hf_home = os.environ.get("HF_HOME") or (
+        Path(os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")) / "huggingface"
+    )
+    return Path(hf_home) / "hub"
+
+
+def hf_model_cached(repo_id: str) -> bool:
+    """True when the hub cache holds a complete snapshot (config.json) of the repo's main ref."""
+    repo_dir = hf_hub_cache_dir() / f"models--{repo_id.replace('/', '--')}"
+    try:
+        commit = (repo_dir / "refs" / "main").read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    return (repo_dir / "snapshots" / commit / "config.json").exists()
+
+
+def hf_warm_flag_path() -> Path:
+    """Return the flag file touched after each successful online run (enables offline mode)."""
+    return app_cache_dir() / "hf_warm.flag"
+
+
+def enable_hf_offline_if_warm(model_name: str) -> bool:
+    """Set HF_HUB_OFFLINE=1 when a recent online run left every needed model in the local cache.
+
+    Must run before huggingface_hub/transformers are imported: both read the
+    variable once at import time.
+    """
+    if os.environ.get("HF_HUB_OFFLINE"):
+        return False
+    try:
+        if time.time() - hf_warm_flag_path().stat().st_mtime >= HF_WARM_FLAG_TTL_SECONDS:
+            return False
+    except OSError:
+        return False
+    repos = (SEGMENTER_REPO, PHONEME_ASR_REPOS.get(model_name, ""))
+    if not all(repo and hf_model_cached(repo) for repo in repos):
+        return False
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    return True
+
+
+def decode_audio(audio_path: str, target_sr: int):
+    """Decode to mono float32 at *target_sr* with soundfile + soxr.
+
+    Matches librosa.load(sr=..., mono=True), which also averages channels and
+    resamples with soxr HQ, without importing librosa. Formats libsndfile
+    cannot read (e.g. m4a/aac) still go through librosa/audioread.
+    """
     import numpy as np
 
-    audio, sample_rate = librosa.load(audio_path, sr=16000, mono=True)
-    return sample_rate, audio.astype(np.float32)
+    try:
+        import soundfile as sf
+        import soxr
+
+        data, sr = sf.read(audio_path, dtype="float32", always_2d=False)
+    except (ImportError, RuntimeError):
+        import librosa
+
+        audio, _ = librosa.load(audio_path, sr=target_sr, mono=True)
+        return audio.astype(np.float32)
+
+    if data.ndim == 2:
+        data = data.mean(axis=1, dtype=np.float32)
+    if sr != target_sr:
+        data = soxr.resample(data, sr, target_sr, quality="HQ")
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+def load_audio(audio_path: str):
+    sample_rate = 16000
+    return sample_rate, decode_audio(audio_path, sample_rate)
 
 
 def resolve_hf_token(cli_token: str) -> str:
@@ -123,13 +479,27 @@ def ensure_quranic_phonemizer(status_writer=None) -> Optional[str]:
     )
 
 
-def validate_hf_model_access(token: str) -> Optional[str]:
+def hf_access_cache_path(token: str) -> Path:
+    """Return the marker recording a recent successful access check for *token* (keyed by hash, never the raw token)."""
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / "qc_hf_ok" / f"{key}.ts"
+
+
+def validate_hf_model_access(token: str, force: bool = False) -> Optional[str]:
     if not token:
         return (
             "HF token is missing. Local Multi-Aligner needs access to private models "
             "hetchyy/r15_95m and hetchyy/r7."
         )
 
+    cache_path = hf_access_cache_path(token)
+    if not force:
+        try:
+            if time.time() - cache_path.stat().st_mtime < HF_ACCESS_CACHE_TTL_SECONDS:
+                return None
+        except OSError:
+            pass
+
     private_models = ["hetchyy/r15_95m", "hetchyy/r7"]
     headers = {"Authorization": f"Bearer {token}"}
 
@@ -156,18 +526,27 @@ def validate_hf_model_access(token: str) -> Optional[str]:
         except Exception as error:
             return f"Failed to validate access to {model_id}: {error}"
 
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(str(int(time.time())), encoding="utf-8")
+    except OSError:
+        pass
     return None
 
 
 def validate_local_data_pickles(status_writer=None) -> Optional[str]:
     data_dir = MULTI_ALIGNER_ROOT / "data"
-    required_pickles = ["phoneme_cache.pkl", "phoneme_ngram_index_5.pkl"]
-    required_json = [
-        "qpc_hafs.json",
-        "surah_info.json",
-        "digital_khatt_v2_script.json",
-        "phoneme_sub_costs.json",
-    ]
+    required_files = [file_name for file_name, _, _ in DATA_FILE_SPECS]
+
+    # Fast path: nothing changed since the last fully successful validation.
+    stamp_path = data_dir / ".ok.stamp"
+    data_signature = data_set_signature(data_dir, required_files)
+    if data_signature is not None:
+        try:
+            if stamp_path.read_text(encoding="utf-8", errors="ignore") == data_signature:
+                return None
+        except OSError:
+            pass
 
     def emit(step: str, message: str) -> None:
         if callable(status_writer):
@@ -176,123 +555,142 @@ def validate_local_data_pickles(status_writer=None) -> Optional[str]:
             except Exception:
                 pass
 
+    download_locks = {file_name: threading.Lock() for file_name in required_files}
+
     def download_data_file(file_name: str, file_path: Path) -> Optional[str]:
+        with download_locks[file_name]:
+            return fetch_data_file(file_name, file_path)
+
+    def fetch_data_file(file_name: str, file_path: Path) -> Optional[str]:
+        """Download *file_name* into *file_path* via a resumable .part file; return an error message or None."""
         url = DATA_FILE_URLS.get(file_name)
         if not url:
             return f"No download URL configured for data file: {file_name}"
 
+        part_path = sidecar_path(file_path, ".part")
+        etag_path = sidecar_path(file_path, ".etag")
         try:
             emit("data", f"Repairing local data file: {file_name}...")
-            request = urllib.request.Request(
-                url,
-                headers={"User-Agent": "QuranCaption/3"},
-                method="GET",
-            )
-            with urllib.request.urlopen(request, timeout=120) as response:
-                payload = response.read()
-            if not payload:
+            for _ in range(2):
+                headers = {"User-Agent": "QuranCaption/3"}
+                # Resume an interrupted download when the remote copy is unchanged.
+                resume_from = part_path.stat().st_size if part_path.exists() else 0
+                prev_etag = etag_path.read_text(encoding="utf-8").strip() if etag_path.exists() else ""
+                resuming = bool(resume_from and prev_etag)
+                if resuming:
+                    headers["Range"] = f"bytes={resume_from}-"
+                    headers["If-Range"] = prev_etag
+
+                response = get_http_pool().request(
+                    "GET",
+                    url,
+                    headers=headers,
+                    preload_content=False,
+                    timeout=120.0,
+                )
+                try:
+                    if resuming and response.status == 416:
+                        # 416 with "bytes */<size>" means the .part is already complete
+                        # (interrupted before os.replace); anything else is a stale copy.
+                        remote_size = response.headers.get("Content-Range", "").rpartition("/")[2]
+                        if remote_size == str(resume_from):
+                            break
+                    if response.status not in (200, 206):
+                        if resuming:
+                            # Drop the partial copy and retry once with a plain GET
+                            part_path.unlink(missing_ok=True)
+                            etag_path.unlink(missing_ok=True)
+                            continue
+                        return f"Failed to download {file_name}: HTTP {response.status}"
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        etag_path.write_text(etag, encoding="utf-8")
+                    # 206 appends to the partial copy; 200 means the remote changed, so restart.
+                    mode = "ab" if response.status == 206 else "wb"
+                    # Stream straight to disk instead of buffering the whole payload.
+                    with open(part_path, mode) as f:
+                        shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+                finally:
+                    response.release_conn()
+                break
+            if part_path.stat().st_size == 0:
+                part_path.unlink()
                 return f"Downloaded empty payload for: {file_name}"
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "wb") as f:
-                f.write(payload)
+            os.replace(part_path, file_path)
             return None
         except Exception as error:
             return f"Failed to download {file_name}: {error}"
 
-    for file_name in required_pickles:
-        file_path = data_dir / file_name
-        if not file_path.exists():
-            download_error = download_data_file(file_name, file_path)
+    # Fetch every missing file up front so they download concurrently over the pool.
+    missing_files = [
+        file_name
+        for file_name in required_files
+        if not (data_dir / file_name).exists()
+    ]
+    if missing_files:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            download_errors = list(
+                executor.map(
+                    lambda file_name: download_data_file(file_name, data_dir / file_name),
+                    missing_files,
+                )
+            )
+        for file_name, download_error in zip(missing_files, download_errors):
             if download_error:
-                return f"Missing required data file: {file_path} ({download_error})"
+                return f"Missing required data file: {data_dir / file_name} ({download_error})"
 
-        try:
-            with open(file_path, "rb") as f:
-                head = f.read(80)
-            if head.startswith(LFS_POINTER_PREFIX):
-                download_error = download_data_file(file_name, file_path)
-                if download_error:
-                    return (
-                        f"Invalid data file (Git LFS pointer): {file_path}. "
-                        f"Auto-repair failed: {download_error}"
-                    )
-                with open(file_path, "rb") as f:
-                    head = f.read(80)
-                if head.startswith(LFS_POINTER_PREFIX):
-                    return (
-                        f"Invalid data file (Git LFS pointer): {file_path}. "
-                        "This file must be real binary content, not a Git LFS pointer."
-                    )
-            if not head or head[0] != 0x80:
-                download_error = download_data_file(file_name, file_path)
-                if download_error:
-                    return (
-                        f"Invalid pickle header for data file: {file_path}. "
-                        f"Auto-repair failed: {download_error}"
-                    )
-                with open(file_path, "rb") as f:
-                    head = f.read(80)
-                if not head or head[0] != 0x80:
-                    return (
-                        f"Invalid pickle header for data file: {file_path}. "
-                        "Expected a binary pickle file."
-                    )
-        except Exception as error:
-            return f"Failed to validate data file {file_path}: {error}"
+    def verify_checksum(file_name: str, file_path: Path) -> Optional[bool]:
+        """Checksum pass: True if the file matches (after a repair if needed), None to fall back to structural checks."""
+        expected = DATA_FILE_SHA256.get(file_name)
+        if not expected:
+            return None
+        if sha256_file(file_path) == expected:
+            return True
+        emit("data", f"Checksum mismatch for {file_name}")
+        if download_data_file(file_name, file_path) is None and sha256_file(file_path) == expected:
+            return True
+        # Upstream may have republished the file since this build; let the
+        # structural checks decide so an updated copy is not re-fetched forever.
+        return None
 
-    for file_name in required_json:
+    def validate_data_file(file_name: str, check_head, check_body) -> Optional[str]:
+        """Check one data file (checksum, then structure), repairing it once if needed; return an error message or None."""
         file_path = data_dir / file_name
-        if not file_path.exists():
-            download_error = download_data_file(file_name, file_path)
-            if download_error:
-                return f"Missing required data file: {file_path} ({download_error})"
-
+        if is_marked_valid(file_path):
+            return None
         try:
-            with open(file_path, "rb") as f:
-                head = f.read(256)
-            if head.startswith(LFS_POINTER_PREFIX):
-                download_error = download_data_file(file_name, file_path)
-                if download_error:
-                    return (
-                        f"Invalid data file (Git LFS pointer): {file_path}. "
-                        f"Auto-repair failed: {download_error}"
-                    )
-                with open(file_path, "rb") as f:
-                    head = f.read(256)
-                if head.startswith(LFS_POINTER_PREFIX):
-                    return (
-                        f"Invalid data file (Git LFS pointer): {file_path}. "
-                        "This file must be real JSON content, not a Git LFS pointer."
-                    )
-            if not head.strip().startswith((b"{", b"[")):
-                download_error = download_data_file(file_name, file_path)
-                if download_error:
-                    return (
-                        f"Invalid JSON header for data file: {file_path}. "
-                        f"Auto-repair failed: {download_error}"
-                    )
-                with open(file_path, "rb") as f:
-                    head = f.read(256)
-                if not head.strip().startswith((b"{", b"[")):
-                    return (
-                        f"Invalid JSON header for data file: {file_path}. "
-                        "Expected a JSON file."
-                    )
-            with open(file_path, "r", encoding="utf-8") as f:
-                json.load(f)
-        except json.JSONDecodeError as error:
-            download_error = download_data_file(file_name, file_path)
-            if download_error:
-                return f"Invalid JSON data file {file_path}: {error} (auto-repair failed: {download_error})"
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    json.load(f)
-            except Exception as second_error:
-                return f"Invalid JSON data file {file_path}: {second_error}"
+            if not verify_checksum(file_name, file_path):
+                problem = inspect_data_file(file_path, check_head, check_body)
+                if problem:
+                    download_error = download_data_file(file_name, file_path)
+                    if download_error:
+                        return (
+                            f"Invalid data file {file_path}: {problem}. "
+                            f"Auto-repair failed: {download_error}"
+                        )
+                    problem = inspect_data_file(file_path, check_head, check_body)
+                    if problem:
+                        return f"Invalid data file {file_path}: {problem}"
         except Exception as error:
             return f"Failed to validate data file {file_path}: {error}"
+        mark_valid(file_path)
+        return None
 
-    return None
+    # Each file is checked independently; overlap their IO and parsing.
+    with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+        errors = list(executor.map(lambda spec: validate_data_file(*spec), DATA_FILE_SPECS))
+    # Report the first failure in file order, as the sequential loops did.
+    first_error = next((error for error in errors if error), None)
+    if first_error is None:
+        # Repairs may have replaced files, so sign the set as it is now.
+        data_signature = data_set_signature(data_dir, required_files)
+        try:
+            if data_signature is not None:
+                stamp_path.write_text(data_signature, encoding="utf-8")
+        except OSError:
+            pass
+    return first_error
 
 
 def main() -> int:
@@ -305,6 +703,11 @@ def main() -> int:
     parser.add_argument("--device", type=str, default="GPU", choices=["GPU", "CPU"])
     parser.add_argument("--hf-token", type=str, default="")
     parser.add_argument("--verbose", action="store_true")
+    parser.add_argument(
+        "--force-auth-check",
+        action="store_true",
+        help="Re-check HF model access even if a recent check succeeded",
+    )
     args = parser.parse_args()
 
     if not os.path.exists(args.audio_path):
@@ -326,91 +729,93 @@ def main() -> int:
 
     token = resolve_hf_token(args.hf_token)
     apply_hf_token_env(token)
+    configure_cache_env()
+    hf_offline = enable_hf_offline_if_warm(args.model_name)
 
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
     original_stderr_fd = os.dup(2)
-    original_stderr = os.fdopen(original_stderr_fd, "w", encoding="utf-8")
-
-    if not args.verbose:
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-        devnull = open(os.devnull, "w")
-        old_stdout_fd = os.dup(1)
-        old_stderr_fd = os.dup(2)
-        os.dup2(devnull.fileno(), 1)
-        os.dup2(devnull.fileno(), 2)
-    else:
-        devnull = None
-        old_stdout_fd = None
-        old_stderr_fd = None
+    original_stderr = os.fdopen(original_stderr_fd, "wb", buffering=4096)
 
     result_payload = None
     error_payload = None
 
-    try:
-        emit_status(original_stderr, "auth", "Validating Hugging Face token...")
-        token_error = validate_hf_model_access(token)
-        if token_error:
-            error_payload = {"error": token_error}
-        else:
-            emit_status(original_stderr, "data", "Validating local Multi-Aligner data files...")
-            data_error = validate_local_data_pickles(
-                lambda step, message: emit_status(original_stderr, step, message)
-            )
-            if data_error:
-                error_payload = {"error": data_error}
-                raise RuntimeError(data_error)
-
-            dep_error = ensure_quranic_phonemizer(
-                lambda step, message: emit_status(original_stderr, step, message)
-            )
-            if dep_error:
-                error_payload = {"error": dep_error}
-                raise RuntimeError(dep_error)
-
-            emit_status(original_stderr, "loading", "Loading audio file...")
-            sample_rate, audio = load_audio(args.audio_path)
-
-            emit_status(original_stderr, "pipeline", "Running local Multi-Aligner pipeline...")
-            from src.pipeline import process_audio
-
-            result = process_audio(
-                (sample_rate, audio),
-                int(args.min_silence_ms),
-                int(args.min_speech_ms),
-                int(args.pad_ms),
-                args.model_name,
-                args.device,
-            )
-
-            if not isinstance(result, tuple) or len(result) < 2:
-                error_payload = {"error": "Unexpected pipeline output format"}
+    with silence_output(args.verbose):
+        try:
+            emit_status(original_stderr, "auth", "Validating Hugging Face token...")
+            token_error = validate_hf_model_access(token, force=args.force_auth_check)
+            if token_error:
+                error_payload = {"error": token_error}
             else:
-                json_output = result[1]
-                cached_segments = None
-                try:
-                    from src.core.segment_types import SegmentInfo, segments_to_json
-
-                    if isinstance(json_output, dict):
-                        result_payload = json_output
-                        segments_json = json_output.get("segments", [])
-                        if isinstance(segments_json, list) and all(isinstance(seg, dict) for seg in segments_json):
-                            cached_segments = [
-                                SegmentInfo.from_json_dict(seg, idx)
-                                for idx, seg in enumerate(segments_json)
-                            ]
-                    elif isinstance(json_output, list):
-                        if all(isinstance(seg, dict) for seg in json_output):
-                            result_payload = {"segments": json_output}
-                            cached_segments = [
-                                SegmentInfo.from_json_dict(seg, idx)
-                                for idx, seg in enumerate(json_output)
-                            ]
-                        elif all(isinstance(seg, SegmentInfo) for seg in json_output):
-                            cached_segments = json_output
-                            result_payload = segments_to_json(json_output)
-                    if result_payload is None:
+                emit_status(original_stderr, "data", "Validating local Multi-Aligner data files...")
+                data_error = validate_local_data_pickles(
+                    lambda step, message: emit_status(original_stderr, step, message)
+                )
+                if data_error:
+                    error_payload = {"error": data_error}
+                    raise RuntimeError(data_error)
+                # Anchoring memory-maps the packed n-gram arrays; read them in while audio/models load.
+                # The per-surah phoneme cache is loaded lazily for the matched surahs only, so it is
+                # left alone. On the first run the arrays do not exist yet and nothing is prefetched.
+                from config import NGRAM_INDEX_ARRAYS_PATH
+
+                prefetch_data_files(sorted(NGRAM_INDEX_ARRAYS_PATH.glob("*")))
+
+                dep_error = ensure_quranic_phonemizer(
+                    lambda step, message: emit_status(original_stderr, step, message)
+                )
+                if dep_error:
+                    error_payload = {"error": dep_error}
+                    raise RuntimeError(dep_error)
+
+                emit_status(original_stderr, "loading", "Loading audio file...")
+                sample_rate, audio = load_audio(args.audio_path)
+
+                emit_status(original_stderr, "pipeline", "Running local Multi-Aligner pipeline...")
+                from src.pipeline import process_audio
+
+                result = process_audio(
+                    (sample_rate, audio),
+                    int(args.min_silence_ms),
+                    int(args.min_speech_ms),
+                    int(args.pad_ms),
+                    args.model_name,
+                    args.device,
+                )
+
+                if not isinstance(result, tuple) or len(result) < 2:
+                    error_payload = {"error": "Unexpected pipeline output format"}
+                else:
+                    json_output = result[1]
+                    cached_segments = None
+                    try:
+                        from src.core.segment_types import SegmentInfo, segments_to_json
+
+                        if isinstance(json_output, dict):
+                            result_payload = json_output
+                            segments_json = json_output.get("segments", [])
+                            if isinstance(segments_json, list) and all(isinstance(seg, dict) for seg in segments_json):
+                                cached_segments = [
+                                    SegmentInfo.from_json_dict(seg, idx)
+                                    for idx, seg in enumerate(segments_json)
+                                ]
+                        elif isinstance(json_output, list):
+                            if all(isinstance(seg, dict) for seg in json_output):
+                                result_payload = {"segments": json_output}
+                                cached_segments = [
+                                    SegmentInfo.from_json_dict(seg, idx)
+                                    for idx, seg in enumerate(json_output)
+                                ]
+                            elif all(isinstance(seg, SegmentInfo) for seg in json_output):
+                                cached_segments = json_output
+                                result_payload = segments_to_json(json_output)
+                        if result_payload is None:
+                            fallback_message = "Pipeline returned no JSON output"
+                            if len(result) > 0 and isinstance(result[0], str):
+                                html_message = result[0].strip()
+                                if html_message:
+                                    fallback_message = html_message
+                            fallback_message = fallback_message.replace("<div>", "").replace("</div>", "").strip()
+                            error_payload = {"error": fallback_message or "Pipeline returned no JSON output"}
+                    except Exception:
                         fallback_message = "Pipeline returned no JSON output"
                         if len(result) > 0 and isinstance(result[0], str):
                             html_message = result[0].strip()
@@ -418,74 +823,69 @@ def main() -> int:
                                 fallback_message = html_message
                         fallback_message = fallback_message.replace("<div>", "").replace("</div>", "").strip()
                         error_payload = {"error": fallback_message or "Pipeline returned no JSON output"}
-                except Exception:
-                    fallback_message = "Pipeline returned no JSON output"
-                    if len(result) > 0 and isinstance(result[0], str):
-                        html_message = result[0].strip()
-                        if html_message:
-                            fallback_message = html_message
-                    fallback_message = fallback_message.replace("<div>", "").replace("</div>", "").strip()
-                    error_payload = {"error": fallback_message or "Pipeline returned no JSON output"}
 
-                try:
-                    if cached_segments and len(cached_segments) > 0:
-                        emit_status(
-                            original_stderr,
-                            "split",
-                            "Refining local segmentation to one verse per segment...",
-                        )
-                        from src.core.segment_types import segments_to_json
-                        from src.pipeline import split_segments_audio
-
-                        split_result = split_segments_audio(
-                            cached_segments,
-                            result[4],
-                            result[5],
-                            result[2],
-                            result[3],
-                            result[6],
-                            1,
-                            None,
-                            None,
-                            False,
-                            cached_log_row=result[8] if len(result) > 8 else None,
-                            cached_segment_dir=result[7] if len(result) > 7 else None,
-                        )
-                        if (
-                            isinstance(split_result, tuple)
-                            and len(split_result) > 1
-                            and isinstance(split_result[1], list)
-                        ):
-                            result_payload = segments_to_json(split_result[1])
+                    try:
+                        if cached_segments and len(cached_segments) > 0:
                             emit_status(
                                 original_stderr,
                                 "split",
-                                "One-verse local recompute completed.",
+                                "Refining local segmentation to one verse per segment...",
                             )
-                except Exception:
-                    # Keep base local segmentation output if split recompute is unavailable.
-                    pass
-    except json.JSONDecodeError as exc:
-        error_payload = {
-            "error": (
-                f"Invalid JSON content detected ({exc}). "
-                "A local Multi-Aligner data file is likely corrupted or still a Git LFS pointer. "
-                "Reinstall Multi-Aligner local dependencies from the app."
-            ),
-            "details": traceback.format_exc(),
-        }
-    except Exception as exc:
-        error_payload = {"error": str(exc), "details": traceback.format_exc()}
-    finally:
-        if not args.verbose and devnull is not None:
-            os.dup2(old_stdout_fd, 1)
-            os.dup2(old_stderr_fd, 2)
-            os.close(old_stdout_fd)
-            os.close(old_stderr_fd)
-            devnull.close()
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
-        original_stderr.close()
+                            from src.core.segment_types import segments_to_json
+                            from src.pipeline import split_segments_audio
+
+                            split_result = split_segments_audio(
+                                cached_segments,
+                                result[4],
+                                result[5],
+                                result[2],
+                                result[3],
+                                result[6],
+                                1,
+                                None,
+                                None,
+                                False,
+                                cached_log_row=result[8] if len(result) > 8 else None,
+                                cached_segment_dir=result[7] if len(result) > 7 else None,
+                            )
+                            if (
+                                isinstance(split_result, tuple)
+                                and len(split_result) > 1
+                                and isinstance(split_result[1], list)
+                            ):
+                                result_payload = segments_to_json(split_result[1])
+                                emit_status(
+                                    original_stderr,
+                                    "split",
+                                    "One-verse local recompute completed.",
+                                )
+                    except Exception:
+                        # Keep base local segmentation output if split recompute is unavailable.
+                        pass
+        except json.JSONDecodeError as exc:
+            error_payload = {
+                "error": (
+                    f"Invalid JSON content detected ({exc}). "
+                    "A local Multi-Aligner data file is likely corrupted or still a Git LFS pointer. "
+                    "Reinstall Multi-Aligner local dependencies from the app."
+                ),
+                "details": traceback.format_exc(),
+            }
+        except Exception as exc:
+            error_payload = {"error": str(exc), "details": traceback.format_exc()}
+        finally:
+            original_stderr.close()
+
+    # Only online runs refresh the warm flag, so offline mode expires and the
+    # models get re-checked against the Hub at least once a week.
+    try:
+        if error_payload is None and not hf_offline:
+            hf_warm_flag_path().parent.mkdir(parents=True, exist_ok=True)
+            hf_warm_flag_path().touch()
+        elif error_payload is not None and hf_offline:
+            hf_warm_flag_path().unlink()
+    except OSError:
+        pass
 
     if error_payload is not None:
         print(json.dumps(error_payload, ensure_ascii=False))
@@ -15,6 +15,7 @@ Output:
 import sys
 import json
 import argparse
+import contextlib
 import os
 from pathlib import Path
 
@@ -57,18 +58,37 @@ def download_data_files():
         print("[SETUP] Downloading required data files...", file=sys.stderr)
         
         try:
-            import urllib.request
             import shutil
+            import urllib3
+            from concurrent.futures import ThreadPoolExecutor
             
-            for filename, filepath, expected_size in files_to_download:
+            # One keep-alive pool shared by all downloads (same host)
+            http = urllib3.PoolManager(maxsize=len(files_to_download),
+                                       retries=urllib3.Retry(3, backoff_factor=0.3))
+            
+            def download_one(filename, filepath, expected_size):
+                """Stream *filename* to a sibling .part file and os.replace it onto *filepath* on HTTP 200.
+
+                Raises on a non-200 status or a transfer error, leaving *filepath* untouched.
+                A size below 95% of *expected_size* only logs a warning; the file is kept and
+                the function returns normally.
+                """
                 url = f"{BASE_URL}/{filename}"
                 print(f"[SETUP] Downloading {filename} (~{expected_size / 1024 / 1024:.1f} MB)...", file=sys.stderr)
                 
-                # Use chunked download for large files
-                req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req, timeout=300) as response:
-                    with open(filepath, 'wb') as out_file:
+                response = http.request('GET', url, headers={'User-Agent': 'Mozilla/5.0'},
+                                        preload_content=False, timeout=300.0)
+                # Write to a sibling .part file so an interrupted download never
+                # leaves a truncated file that the exists() check above accepts
+                part_path = filepath.with_suffix(filepath.suffix + '.part')
+                try:
+                    if response.status != 200:
+                        raise RuntimeError(f"HTTP {response.status} for {filename}")
+                    with open(part_path, 'wb') as out_file:
                         shutil.copyfileobj(response, out_file, length=1024*1024)  # 1MB chunks
+                finally:
+                    response.release_conn()
+                os.replace(part_path, filepath)
                 
                 actual_size = filepath.stat().st_size
                 print(f"[SETUP] Downloaded {filename} ({actual_size / 1024 / 1024:.1f} MB)", file=sys.stderr)
@@ -76,6 +96,10 @@ def download_data_files():
                 # Verify file size
                 if actual_size < expected_size * 0.95:
                     print(f"[WARNING] File may be incomplete: {actual_size} < {expected_size}", file=sys.stderr)
+            
+            # Download concurrently; list() re-raises the first failure
+            with ThreadPoolExecutor(max_workers=len(files_to_download)) as executor:
+                list(executor.map(lambda item: download_one(*item), files_to_download))
         
         except Exception as e:
             print(f"[ERROR] Failed to download data files: {e}", file=sys.stderr)
@@ -85,6 +109,37 @@ def download_data_files():
     return True
 
 
+@contextlib.contextmanager
+def silence_output(verbose):
+    """Point fds 1/2 at devnull for the duration (unless verbose).
+    
+    sys.stdout/sys.stderr keep their real streams; they write through the same
+    fds, so library output is discarded instead of piling up in memory.
+    """
+    if verbose:
+        yield
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    saved_fds = (os.dup(1), os.dup(2))
+    os.dup2(devnull_fd, 1)
+    os.dup2(devnull_fd, 2)
+    try:
+        yield
+    finally:
+        # Drain buffered output into devnull before restoring the real fds
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        for fd in (*saved_fds, devnull_fd):
+            os.close(fd)
+
+
 def check_dependencies():
     """Check if required Python packages are installed."""
     missing = []
@@ -166,14 +221,27 @@ def check_dependencies():
 
 
 def load_audio(audio_path: str):
-    """Load audio file using librosa."""
-    import librosa
+    """Load audio as 16kHz mono float32."""
     import numpy as np
     
-    # Load audio, resample to 16kHz mono
-    audio, sample_rate = librosa.load(audio_path, sr=16000, mono=True)
+    # Load audio, resample to 16kHz mono. soundfile + soxr give the same result
+    # as librosa.load (channel mean + soxr HQ) without importing librosa.
+    sample_rate = 16000
+    try:
+        import soundfile as sf
+        import soxr
+        audio, file_sr = sf.read(audio_path, dtype='float32', always_2d=False)
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        if file_sr != sample_rate:
+            audio = soxr.resample(audio, file_sr, sample_rate, quality='HQ')
+    except (ImportError, RuntimeError):
+        # Formats libsndfile can't read (e.g. m4a) go through librosa/audioread
+        import librosa
+        audio, sample_rate = librosa.load(audio_path, sr=sample_rate, mono=True)
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
     
-    return audio.astype(np.float32), sample_rate
+    return audio, sample_rate
 
 
 def main():
@@ -219,14 +287,6 @@ Examples:
         print(json.dumps({"error": f"Failed to download data files: {str(e)}"}))
         sys.exit(1)
     
-    # Suppress verbose output if not requested
-    # We need to capture BOTH stdout and stderr because libraries like torch/transformers
-    # print to stdout during model loading
-    import io
-    
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    
     # Save original stderr fd for status messages (before any redirection)
     original_stderr_fd = os.dup(2)
     original_stderr_file = os.fdopen(original_stderr_fd, 'w', encoding='utf-8')
@@ -241,58 +301,40 @@ Examples:
         except:
             pass
     
-    if not args.verbose:
-        # Redirect both stdout and stderr to suppress library output
-        sys.stderr = io.StringIO()
-        sys.stdout = io.StringIO()
-        # Also suppress low-level file descriptor output
-        devnull = open(os.devnull, 'w')
-        old_stdout_fd = os.dup(1)
-        old_stderr_fd = os.dup(2)
-        os.dup2(devnull.fileno(), 1)
-        os.dup2(devnull.fileno(), 2)
-    
     result = None
     error_result = None
     
-    try:
-        # Emit loading status
-        emit_status_to_stderr("loading", "Loading audio file...")
-        
-        # Load audio
-        audio, sample_rate = load_audio(args.audio_path)
-        
-        # Run segmentation pipeline
-        from segment_core.segment_processor import process_audio_full
-        
-        result = process_audio_full(
-            audio=audio,
-            sample_rate=sample_rate,
-            min_silence_ms=args.min_silence_ms,
-            min_speech_ms=args.min_speech_ms,
-            pad_ms=args.pad_ms,
-            whisper_model=args.whisper_model,
-            status_callback=emit_status_to_stderr
-        )
-        
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        error_result = {
-            "error": str(e),
-            "details": error_details
-        }
-    
-    finally:
-        # Restore stdout/stderr BEFORE printing result
-        if not args.verbose:
-            os.dup2(old_stdout_fd, 1)
-            os.dup2(old_stderr_fd, 2)
-            os.close(old_stdout_fd)
-            os.close(old_stderr_fd)
-            devnull.close()
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+    # Suppress verbose output if not requested. Libraries like torch/transformers
+    # print to both stdout and stderr during model loading; stdout is restored
+    # before the result is printed.
+    with silence_output(args.verbose):
+        try:
+            # Emit loading status
+            emit_status_to_stderr("loading", "Loading audio file...")
+            
+            # Load audio
+            audio, sample_rate = load_audio(args.audio_path)
+            
+            # Run segmentation pipeline
+            from segment_core.segment_processor import process_audio_full
+            
+            result = process_audio_full(
+                audio=audio,
+                sample_rate=sample_rate,
+                min_silence_ms=args.min_silence_ms,
+                min_speech_ms=args.min_speech_ms,
+                pad_ms=args.pad_ms,
+                whisper_model=args.whisper_model,
+                status_callback=emit_status_to_stderr
+            )
+            
+        except Exception as e:
+            import traceback
+            error_details = traceback.format_exc()
+            error_result = {
+                "error": str(e),
+                "details": error_details
+            }
     
     # Now print the result (with restored stdout)
     if error_result:
@@ -8,6 +8,12 @@ from pathlib import Path
 # Suppress HF model download progress bars (hundreds of lines on cold start)
 os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
 
+# Persist Inductor/Triton compile artifacts so torch.compile warm-up is paid once per machine
+_compile_cache = Path(os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")) / "quran-aligner"
+os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(_compile_cache / "inductor"))
+os.environ.setdefault("TRITON_CACHE_DIR", str(_compile_cache / "triton"))
+
 # Load .env file for local dev (HF_TOKEN for private model access)
 _env_path = Path(__file__).parent / ".env"
 if _env_path.exists():
@@ -23,11 +29,60 @@ sys.path.insert(0, str(_app_path))
 
 # Build Cython extensions in-place (falls back to pure Python if it fails)
 import subprocess
-subprocess.run(
-    [sys.executable, str(_app_path / "setup.py"), "build_ext", "--inplace"],
-    cwd=str(_app_path),
-    capture_output=True,
-)
+from importlib.machinery import EXTENSION_SUFFIXES
+
+_build_stamp = _app_path / "._build_stamp"
+
+
+def _cython_build_signature() -> str:
+    """Fingerprint of the Cython sources, build flags (setup.py) and interpreter."""
+    parts = [sys.version.split()[0], f"setup.py:{(_app_path / 'setup.py').stat().st_mtime_ns}"]
+    for pyx in sorted((_app_path / "src").rglob("*.pyx")):
+        for src in (pyx, pyx.with_suffix(".c")):
+            if src.exists():
+                parts.append(f"{src.relative_to(_app_path)}:{src.stat().st_mtime_ns}")
+    return "|".join(parts)
+
+
+def _built_extension_mtimes(pyx: Path) -> list:
+    """mtimes of the compiled extensions built from *pyx* (empty if none exist)."""
+    built = [pyx.with_name(pyx.stem + suffix) for suffix in EXTENSION_SUFFIXES]
+    return [p.stat().st_mtime_ns for p in built if p.exists()]
+
+
+def _cython_build_needed(signature: str) -> bool:
+    """True if an extension is missing, or the stamp is stale and a source is newer than its build."""
+    try:
+        stamp_ok = _build_stamp.read_text(encoding="utf-8") == signature
+    except OSError:
+        stamp_ok = False
+    for pyx in (_app_path / "src").rglob("*.pyx"):
+        built_mtimes = _built_extension_mtimes(pyx)
+        if not built_mtimes:
+            return True
+        if stamp_ok:
+            continue
+        sources = [p for p in (pyx, pyx.with_suffix(".c"), _app_path / "setup.py") if p.exists()]
+        if max(p.stat().st_mtime_ns for p in sources) > max(built_mtimes):
+            return True
+    return False
+
+
+_build_signature = _cython_build_signature()
+if _cython_build_needed(_build_signature):
+    _build = subprocess.run(
+        [sys.executable, str(_app_path / "setup.py"), "build_ext", "--inplace"],
+        cwd=str(_app_path),
+        capture_output=True,
+    )
+    # Only a complete, successful build is stamped; failures retry on the next import
+    if _build.returncode == 0 and all(
+        _built_extension_mtimes(pyx) for pyx in (_app_path / "src").rglob("*.pyx")
+    ):
+        try:
+            _build_stamp.write_text(_build_signature, encoding="utf-8")
+        except OSError:
+            pass
 
 # Log Cython DP status
 try:
@@ -124,15 +179,27 @@ if __name__ == "__main__":
     if args.dev:
         print("Dev mode: skipping model preloading (models load on first request)")
     else:
-        # Preload models and caches at startup so first request is fast
-        print("Preloading models...")
-        load_segmenter()
-        load_phoneme_asr("Base")
-        load_phoneme_asr("Large")
-        print("Models preloaded.")
-        print("Preloading caches...")
-        get_ngram_index()
-        preload_all_chapters()
+        # Preload models and caches at startup so first request is fast.
+        # Model loads serialize on model_device_lock, so they share one worker;
+        # the n-gram index and phoneme cache unpickle alongside them.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _preload_models():
+            """Load the segmenter and both phoneme ASR models; runs on the pool so the cache loads overlap it."""
+            load_segmenter()
+            load_phoneme_asr("Base")
+            load_phoneme_asr("Large")
+            print("Models preloaded.")
+
+        print("Preloading models and caches...")
+        with ThreadPoolExecutor(max_workers=3) as _preload_pool:
+            _preload_futures = [
+                _preload_pool.submit(_preload_models),
+                _preload_pool.submit(get_ngram_index),
+                _preload_pool.submit(preload_all_chapters),
+            ]
+            for _future in _preload_futures:
+                _future.result()
         print("Caches preloaded.")
 
         # Warm up soxr resampler so first request doesn't pay initialization cost
@@ -2,7 +2,9 @@
 Configuration settings for the Segments App.
 """
 import os
+from collections import namedtuple
 from pathlib import Path
+from types import MappingProxyType
 
 # HF Spaces detection
 IS_HF_SPACE = os.environ.get("SPACE_ID") is not None
@@ -138,10 +140,12 @@ QURAN_SCRIPT_PATH_DISPLAY = DATA_PATH / "digital_khatt_v2_script.json"
 
 # Pre-built phoneme cache (all 114 chapters)
 PHONEME_CACHE_PATH = DATA_PATH / "phoneme_cache.pkl"
+PHONEME_CACHE_DIR = DATA_PATH / "phoneme_cache"  # per-surah split of the pickle, written on first lazy load
 
 # Phoneme n-gram index for anchor detection
 NGRAM_SIZE = 5
 NGRAM_INDEX_PATH = DATA_PATH / f"phoneme_ngram_index_{NGRAM_SIZE}.pkl"
+NGRAM_INDEX_ARRAYS_PATH = DATA_PATH / f"phoneme_ngram_index_{NGRAM_SIZE}.arrays"  # mmap-able cache derived from the pickle
 
 # =============================================================================
 # ZeroGPU Lease Timings
@@ -150,18 +154,21 @@ NGRAM_INDEX_PATH = DATA_PATH / f"phoneme_ngram_index_{NGRAM_SIZE}.pkl"
 ZEROGPU_MAX_DURATION = 120  # Hard cap enforced by HF ZeroGPU
 AUDIO_DURATION_WARNING_MINUTES = 300  # Warn user on upload if audio exceeds this (minutes)
 
+VAD_LEASE_BUFFER = 5
+# model_name -> (slope, intercept + lease buffer); unknown models use Base
+ASR_DURATION_COEFFS = {
+    "Base": (0.0198, 0.32 + 4.5),
+    "Large": (0.0579, 1.72 + 6.54),
+}
+
 def get_vad_duration(minutes):
     """GPU seconds needed for VAD based on audio minutes."""
-    VAD_LEASE_BUFFER = 5
     return max(3, 0.28 * minutes + 1.66 + VAD_LEASE_BUFFER)
 
 def get_asr_duration(minutes, model_name="Base"):
     """GPU seconds needed for ASR, scales linearly with audio duration."""
-    if model_name == "Large":
-        ASR_LEASE_BUFFER = 6.54
-        return max(3, 0.0579 * minutes + 1.72 + ASR_LEASE_BUFFER)
-    ASR_LEASE_BUFFER = 4.5
-    return max(3, 0.0198 * minutes + 0.32 + ASR_LEASE_BUFFER)
+    slope, offset = ASR_DURATION_COEFFS.get(model_name, ASR_DURATION_COEFFS["Base"])
+    return max(3, slope * minutes + offset)
 
 # =============================================================================
 # Estimations
@@ -195,8 +202,17 @@ MAX_PAD_WASTE = 0.2          # Max fraction of padded tensor that is wasted (0=n
 MIN_BATCH_SIZE = 8           # Minimum segments per batch (prevents underutilization)
 
 # Model precision
-DTYPE = "float16"
-TORCH_COMPILE = True  # Apply torch.compile() to GPU models (reduce-overhead mode)
+DTYPE = "bfloat16"  # GPU dtype; falls back to float16 on GPUs without native bf16 (pre-Ampere)
+# Optional int8 dynamic quantization of the Base ASR Linear layers on local CPU
+# runs ("int8_dynamic" or "none"). Weights become int8, activations stay fp32.
+ASR_QUANT = os.environ.get("ASR_QUANT", "none").lower()
+TORCH_COMPILE = True  # Apply torch.compile() to GPU models (local GPU only)
+# "default", not "reduce-overhead": with dynamic shapes Inductor reuses one graph,
+# but CUDA graphs are still recorded per distinct padded batch shape, and
+# duration-bucketed batches almost never repeat a shape — each recording would
+# cost memory and capture time for a graph replayed once.
+TORCH_COMPILE_MODE = "default"
+TORCH_COMPILE_DYNAMIC = True  # Symbolic batch/length dims: one Inductor graph for all segment shapes instead of a recompile per shape
 
 # AOTInductor compilation (ZeroGPU optimization)
 AOTI_ENABLED = True            # Enable AOT compilation for VAD model on HF Space
@@ -293,6 +309,7 @@ REVIEW_SUMMARY_MAX_SEGMENTS = 15  # Max segment numbers to list before truncatin
 
 MFA_SPACE_URL = "https://hetchyy-quran-phoneme-mfa.hf.space"
 MFA_TIMEOUT = 240
+MFA_MAX_CONNECTIONS = 8         # Keep-alive connections pooled for the MFA Space
 MFA_METHOD = "kalpy"            # "kalpy", "align_one", "python_api", "cli"
 MFA_BEAM = 15                   # Viterbi beam width
 MFA_RETRY_BEAM = 40             # Retry beam width (used when initial alignment fails)
@@ -421,35 +438,17 @@ ANIM_WINDOW_AFTER_MAX = 15
 # Presets map mode names to window engine parameter values
 ANIM_DISPLAY_MODE_DEFAULT = "Reveal"
 ANIM_DISPLAY_MODES = ["Reveal", "Fade", "Spotlight", "Isolate", "Consume", "Custom"]
-ANIM_PRESETS = {
-    "Reveal":    {
-        "prev_opacity": 1.0,
-        "prev_words": ANIM_WINDOW_PREV_MAX,
-        "after_opacity": 0.0,
-        "after_words": 0,
-    },
-    "Fade":      {
-        "prev_opacity": 1.0,
-        "prev_words": ANIM_WINDOW_PREV_MAX,
-        "after_opacity": 0.3,
-        "after_words": ANIM_WINDOW_AFTER_MAX,
-    },
-    "Spotlight": {
-        "prev_opacity": 0.3,
-        "prev_words": ANIM_WINDOW_PREV_MAX,
-        "after_opacity": 0.3,
-        "after_words": ANIM_WINDOW_AFTER_MAX,
-    },
-    "Isolate": {
-        "prev_opacity": 0,
-        "prev_words": 0,
-        "after_opacity": 0,
-        "after_words": 0,
-    },
-    "Consume": {
-        "prev_opacity": 0,
-        "prev_words": 0,
-        "after_opacity": 0.3,
-        "after_words": ANIM_WINDOW_AFTER_MAX,
-    }
-}
+# Read-only: presets are shared module state, and namedtuple fields are plain attribute reads
+AnimPreset = namedtuple("AnimPreset", "prev_opacity prev_words after_opacity after_words")
+ANIM_PRESETS = MappingProxyType({
+    "Reveal":    AnimPreset(prev_opacity=1.0, prev_words=ANIM_WINDOW_PREV_MAX,
+                            after_opacity=0.0, after_words=0),
+    "Fade":      AnimPreset(prev_opacity=1.0, prev_words=ANIM_WINDOW_PREV_MAX,
+                            after_opacity=0.3, after_words=ANIM_WINDOW_AFTER_MAX),
+    "Spotlight": AnimPreset(prev_opacity=0.3, prev_words=ANIM_WINDOW_PREV_MAX,
+                            after_opacity=0.3, after_words=ANIM_WINDOW_AFTER_MAX),
+    "Isolate":   AnimPreset(prev_opacity=0, prev_words=0,
+                            after_opacity=0, after_words=0),
+    "Consume":   AnimPreset(prev_opacity=0, prev_words=0,
+                            after_opacity=0.3, after_words=ANIM_WINDOW_AFTER_MAX),
+})
@@ -1,8 +1,30 @@
 """Build Cython extensions (DP alignment core)."""
 
 from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
 from Cython.Build import cythonize
 
+# Optimisation flags per compiler family. No -ffast-math: the DP uses INFINITY
+# as its unreachable-cell sentinel, which fast-math is allowed to fold away.
+# No -march=native either, so a build can be copied to another machine.
+COMPILE_ARGS = {
+    "msvc": ["/O2"],
+    "unix": ["-O3"],
+    "mingw32": ["-O3"],
+}
+
+
+class OptimizedBuildExt(build_ext):
+    """build_ext that adds COMPILE_ARGS for the active compiler."""
+
+    def build_extensions(self):
+        """Prepend the optimisation flags for the detected compiler to every extension."""
+        args = COMPILE_ARGS.get(self.compiler.compiler_type, [])
+        for ext in self.extensions:
+            ext.extra_compile_args = args + list(ext.extra_compile_args or [])
+        super().build_extensions()
+
+
 extensions = [
     Extension(
         "src.alignment._dp_core",
@@ -11,5 +33,9 @@ extensions = [
 ]
 
 setup(
-    ext_modules=cythonize(extensions, language_level="3"),
+    ext_modules=cythonize(
+        extensions,
+        language_level="3",
+    ),
+    cmdclass={"build_ext": OptimizedBuildExt},
 )
@@ -1,5 +1,6 @@
 """Orchestration for phoneme-based alignment and retries."""
 
+from bisect import bisect_right
 from typing import List, Tuple
 
 from config import (
@@ -8,9 +9,27 @@ from config import (
     RETRY_LOOKBACK_WORDS,
     RETRY_LOOKAHEAD_WORDS,
     MAX_EDIT_DISTANCE_RELAXED,
+    MAX_SPECIAL_EDIT_DISTANCE,
     PHONEME_ALIGNMENT_PROFILING,
 )
 from src.core.debug_collector import get_debug_collector
+from .ngram_index import get_ngram_index
+from .phoneme_anchor import verse_to_word_index, find_anchor_by_voting
+from .phoneme_matcher import align_segment, get_matched_text
+from .phoneme_matcher_cache import get_chapter_reference
+from .special_segments import (
+    SPECIAL_PHONEMES, SPECIAL_TEXT, TRANSITION_TEXT,
+    detect_transition_segment, detect_inter_chapter_specials,
+)
+
+
+# Special-segment refs that already contain the Basmala
+_BASMALA_REFS = frozenset(("Basmala", "Isti'adha+Basmala"))
+
+# A Basmala fused into a segment leaves at least this much plain-alignment
+# cost (unmatched ASR phonemes) even when it is recognised at the edge of
+# the special-segment threshold
+_BASMALA_MIN_UNMATCHED = len(SPECIAL_PHONEMES["Basmala"]) * MAX_SPECIAL_EDIT_DISTANCE
 
 
 def _debug_alignment_result(alignment, chapter_ref):
@@ -55,11 +74,6 @@ def run_phoneme_matching(
         merged_into: dict mapping consumed segment indices to their target segment index
         repetition_segments: set of segment indices where wraps were detected
     """
-    from .phoneme_matcher import align_segment, get_matched_text
-    from .phoneme_matcher_cache import get_chapter_reference
-    from .phoneme_anchor import verse_to_word_index, find_anchor_by_voting
-    from .ngram_index import get_ngram_index
-
     # Only import time if profiling enabled
     if PHONEME_ALIGNMENT_PROFILING:
         import time
@@ -77,19 +91,23 @@ def run_phoneme_matching(
     # Parallel list: None for specials/failures, (start_word_idx, end_word_idx) for matches
     word_indices = [None] * len(results)
 
-    # Timing accumulators (only used if profiling enabled)
-    if PHONEME_ALIGNMENT_PROFILING:
-        dp_times = []
-        window_setup_total = 0.0
-        result_build_total = 0.0
+    # Timing accumulators (only filled if profiling enabled)
+    dp_times = []
+    window_setup_total = 0.0
+    result_build_total = 0.0
+
+    def _record_timing(timing):
+        """Add one align_segment() timing dict to the profiling accumulators."""
+        nonlocal window_setup_total, result_build_total
+        if not PHONEME_ALIGNMENT_PROFILING:
+            return
+        dp_times.append(timing['dp_time'])
+        window_setup_total += timing['window_setup_time']
+        result_build_total += timing['result_build_time']
 
     # Track whether the next segment might have Basmala fused with verse content
-    from .special_segments import (
-        SPECIAL_PHONEMES, SPECIAL_TEXT, TRANSITION_TEXT,
-        detect_transition_segment, detect_inter_chapter_specials,
-    )
     basmala_already_detected = any(
-        r[2] in ("Basmala", "Isti'adha+Basmala") for r in (special_results or [])
+        r[2] in _BASMALA_REFS for r in (special_results or [])
     )
     is_first_after_transition = not basmala_already_detected
 
@@ -149,12 +167,17 @@ def run_phoneme_matching(
             transition_skips += 1
             continue
 
-        segment_idx = first_quran_idx + i + 1  # 1-indexed for display
+        abs_idx = first_quran_idx + i  # index into phoneme_texts
+        segment_idx = abs_idx + 1  # 1-indexed for display
         segments_attempted += 1
+        # Unrestricted transition check for this segment; up to three paths below
+        # ask for it, so it is computed at most once
+        trans_result = None
 
         # Transition mode: keep checking for transitions before trying alignment
         if transition_mode:
-            trans_name, trans_conf = detect_transition_segment(asr_phonemes)
+            trans_result = detect_transition_segment(asr_phonemes)
+            trans_name, trans_conf = trans_result
             if trans_name:
                 print(f"  [TRANSITION-MODE] Segment {segment_idx}: {trans_name} (conf={trans_conf:.2f})")
                 _dc = get_debug_collector()
@@ -168,12 +191,12 @@ def run_phoneme_matching(
 
                 # Tahmeed peek-ahead for merge
                 if trans_name == "Tahmeed":
-                    next_abs = first_quran_idx + i + 1
+                    next_abs = abs_idx + 1
                     if next_abs < len(phoneme_texts) and phoneme_texts[next_abs]:
                         resp_name, resp_conf = detect_transition_segment(
                             phoneme_texts[next_abs], allowed={"Tahmeed"})
                         if resp_name:
-                            merged_into[next_abs] = first_quran_idx + i
+                            merged_into[next_abs] = abs_idx
                             tahmeed_merge_skip = 1
                             print(f"  [TAHMEED-MERGE] Next segment merged into Tahmeed")
                             if _dc is not None:
@@ -185,7 +208,7 @@ def run_phoneme_matching(
                 # Exit transition mode, global reanchor
                 transition_mode = False
                 print(f"  [TRANSITION-MODE] Exiting at segment {segment_idx}, running global reanchor...")
-                remaining_idx = first_quran_idx + i
+                remaining_idx = abs_idx
                 remaining_texts = phoneme_texts[remaining_idx:]
                 if remaining_texts:
                     reanchor_surah, reanchor_ayah = find_anchor_by_voting(
@@ -216,11 +239,7 @@ def run_phoneme_matching(
         alignment, timing = align_segment(asr_phonemes, chapter_ref, pointer, segment_idx)
         num_segments += 1
 
-        # Accumulate timing if profiling enabled
-        if PHONEME_ALIGNMENT_PROFILING:
-            dp_times.append(timing['dp_time'])
-            window_setup_total += timing['window_setup_time']
-            result_build_total += timing['result_build_time']
+        _record_timing(timing)
 
         # Debug collector: primary alignment attempt
         _dc = get_debug_collector()
@@ -235,7 +254,7 @@ def run_phoneme_matching(
 
         # Chapter transition: pointer past end of chapter
         if alignment is None and pointer >= chapter_ref.num_words:
-            remaining_phonemes = phoneme_texts[first_quran_idx + i:]
+            remaining_phonemes = phoneme_texts[abs_idx:]
             amin_consumed = 0
 
             if chapter_ref.surah == 1:
@@ -249,9 +268,10 @@ def run_phoneme_matching(
                     transition_skips += 1
                     amin_consumed = 1
                     # Re-slice remaining phonemes to start after Amin
-                    remaining_phonemes = phoneme_texts[first_quran_idx + i + 1:]
+                    remaining_phonemes = phoneme_texts[abs_idx + 1:]
 
             inter_specials, num_consumed = detect_inter_chapter_specials(remaining_phonemes)
+            has_basmala = any(s[2] in _BASMALA_REFS for s in inter_specials)
 
             if chapter_ref.surah == 1:
                 # After Al-Fatiha, the next chapter could be anything — global reanchor
@@ -263,7 +283,7 @@ def run_phoneme_matching(
                                   from_surah=1, next_action="global_reanchor")
 
                 # Use segments after Amin + specials for anchor voting
-                anchor_offset = first_quran_idx + i + amin_consumed + num_consumed
+                anchor_offset = abs_idx + amin_consumed + num_consumed
                 anchor_remaining = phoneme_texts[anchor_offset:]
 
                 reanchor_surah, reanchor_ayah = find_anchor_by_voting(
@@ -301,7 +321,9 @@ def run_phoneme_matching(
                 else:
                     # Check for transition before committing to next sequential surah
                     if num_consumed == 0:
-                        trans_name, trans_conf = detect_transition_segment(asr_phonemes)
+                        if trans_result is None:
+                            trans_result = detect_transition_segment(asr_phonemes)
+                        trans_name, trans_conf = trans_result
                         if trans_name:
                             print(f"  [CHAPTER-END-TRANSITION] Segment {segment_idx}: {trans_name} "
                                   f"at end of Surah {chapter_ref.surah} (conf={trans_conf:.2f})")
@@ -333,7 +355,6 @@ def run_phoneme_matching(
                 if amin_consumed > 0:
                     # Current segment was Amin (already appended above).
                     # Queue inter-chapter specials for subsequent segments.
-                    has_basmala = any(s[2] in ("Basmala", "Isti'adha+Basmala") for s in inter_specials)
                     is_first_after_transition = not has_basmala
                     if num_consumed > 0:
                         pending_specials = list(inter_specials)
@@ -343,7 +364,6 @@ def run_phoneme_matching(
                     continue
 
                 if num_consumed > 0:
-                    has_basmala = any(s[2] in ("Basmala", "Isti'adha+Basmala") for s in inter_specials)
                     is_first_after_transition = not has_basmala
                     # Current segment is a special — append its result
                     results.append(inter_specials[0])
@@ -359,27 +379,25 @@ def run_phoneme_matching(
                     # No specials — re-try alignment on this segment against the new chapter
                     alignment, timing = align_segment(asr_phonemes, chapter_ref, pointer, segment_idx)
                     num_segments += 1
-                    if PHONEME_ALIGNMENT_PROFILING:
-                        dp_times.append(timing['dp_time'])
-                        window_setup_total += timing['window_setup_time']
-                        result_build_total += timing['result_build_time']
+                    _record_timing(timing)
                     # Fall through to existing if/else below
 
         # Basmala-fused retry: if this is the first segment after a transition
         # and Basmala wasn't detected, the reciter may have merged Basmala with
-        # the first verse. Always try prepending Basmala phonemes to R and pick
-        # the better result (even if the plain alignment already succeeded).
-        if is_first_after_transition:
-            is_first_after_transition = False
-
+        # the first verse. Try prepending Basmala phonemes to R and pick the
+        # better result. Skipped when the plain alignment leaves too few ASR
+        # phonemes unmatched to hide even a badly recognised Basmala.
+        try_basmala_fused = is_first_after_transition and (
+            alignment is None
+            or (1.0 - alignment.confidence) * len(asr_phonemes) >= _BASMALA_MIN_UNMATCHED
+        )
+        is_first_after_transition = False
+        if try_basmala_fused:
             basmala_alignment, basmala_timing = align_segment(
                 asr_phonemes, chapter_ref, pointer, segment_idx,
                 basmala_prefix=True)
             num_segments += 1
-            if PHONEME_ALIGNMENT_PROFILING:
-                dp_times.append(basmala_timing['dp_time'])
-                window_setup_total += basmala_timing['window_setup_time']
-                result_build_total += basmala_timing['result_build_time']
+            _record_timing(basmala_timing)
 
             if basmala_alignment and basmala_alignment.basmala_consumed:
                 existing_conf = alignment.confidence if alignment else 0.0
@@ -420,7 +438,9 @@ def run_phoneme_matching(
             segments_passed += 1
         else:
             # === Check for transition segment before retry tiers ===
-            trans_name, trans_conf = detect_transition_segment(asr_phonemes)
+            if trans_result is None:
+                trans_result = detect_transition_segment(asr_phonemes)
+            trans_name, trans_conf = trans_result
             if trans_name:
                 print(f"  [TRANSITION] Segment {segment_idx}: {trans_name} (conf={trans_conf:.2f})")
                 _dc = get_debug_collector()
@@ -435,12 +455,12 @@ def run_phoneme_matching(
 
                 # Tahmeed peek-ahead for merge
                 if trans_name == "Tahmeed":
-                    next_abs = first_quran_idx + i + 1
+                    next_abs = abs_idx + 1
                     if next_abs < len(phoneme_texts) and phoneme_texts[next_abs]:
                         resp_name, resp_conf = detect_transition_segment(
                             phoneme_texts[next_abs], allowed={"Tahmeed"})
                         if resp_name:
-                            merged_into[next_abs] = first_quran_idx + i
+                            merged_into[next_abs] = abs_idx
                             tahmeed_merge_skip = 1
                             print(f"  [TAHMEED-MERGE] Next segment merged into Tahmeed")
                             if _dc is not None:
@@ -465,10 +485,7 @@ def run_phoneme_matching(
             )
             retry_timing = timing
             num_segments += 1
-            if PHONEME_ALIGNMENT_PROFILING:
-                dp_times.append(timing['dp_time'])
-                window_setup_total += timing['window_setup_time']
-                result_build_total += timing['result_build_time']
+            _record_timing(timing)
 
             if alignment:
                 # Retry succeeded
@@ -541,7 +558,7 @@ def run_phoneme_matching(
                     consec_reanchors += 1
                     consec_at_trigger = consecutive_failures
                     # Global re-anchor (not constrained to current surah)
-                    remaining_idx = first_quran_idx + i + 1
+                    remaining_idx = abs_idx + 1
                     remaining_texts = phoneme_texts[remaining_idx:]
                     if remaining_texts:
                         reanchor_surah, reanchor_ayah = find_anchor_by_voting(
@@ -574,21 +591,25 @@ def run_phoneme_matching(
 
     # Post-processing: detect consecutive segments with reference gaps
     # (gap_segments may already have entries from chapter-transition checks above)
+    first_matched = None
     prev_matched_idx = None
+    prev_surah = None
+    prev_end = -1
     for idx in range(len(results)):
-        if word_indices[idx] is None:
+        span = word_indices[idx]
+        if span is None:
             continue
 
-        if prev_matched_idx is not None:
-            # Skip gap check across chapter transitions — word indices are per-chapter
-            prev_ref = results[prev_matched_idx][2]
-            curr_ref = results[idx][2]
-            prev_surah = prev_ref.split(":")[0] if prev_ref and ":" in prev_ref else None
-            curr_surah = curr_ref.split(":")[0] if curr_ref and ":" in curr_ref else None
+        # Each matched ref is split once; the previous match's surah/end are carried over
+        curr_ref = results[idx][2]
+        curr_surah = curr_ref.split(":", 1)[0] if curr_ref and ":" in curr_ref else None
 
+        if prev_matched_idx is None:
+            first_matched = idx
+        else:
+            # Skip gap check across chapter transitions — word indices are per-chapter
             if prev_surah is not None and prev_surah == curr_surah:
-                prev_end = word_indices[prev_matched_idx][1]
-                curr_start = word_indices[idx][0]
+                curr_start = span[0]
                 gap = curr_start - prev_end - 1
 
                 if gap > 0:
@@ -609,9 +630,13 @@ def run_phoneme_matching(
                                       missing_word_refs=missing_refs)
 
         prev_matched_idx = idx
+        prev_surah = curr_surah
+        prev_end = span[1]
+
+    # First/last matched segments fall out of the scan above
+    last_matched = prev_matched_idx
 
     # Edge case: missing words at start of expected range
-    first_matched = next((i for i, w in enumerate(word_indices) if w is not None), None)
     if first_matched is not None:
         first_ref = results[first_matched][2]
         first_surah = first_ref.split(":")[0] if first_ref and ":" in first_ref else None
@@ -637,7 +662,6 @@ def run_phoneme_matching(
     # remaining audio — the words aren't missing, they just failed to align.
     # Compare against the verse boundary (not chapter end), since a recitation
     # doesn't necessarily cover the entire chapter.
-    last_matched = next((i for i in range(len(word_indices) - 1, -1, -1) if word_indices[i] is not None), None)
     if last_matched is not None and last_matched == len(word_indices) - 1:
         last_ref = results[last_matched][2]
         last_surah = last_ref.split(":")[0] if last_ref and ":" in last_ref else None
@@ -647,10 +671,7 @@ def run_phoneme_matching(
             if 0 <= last_end < last_chapter_ref.num_words:
                 last_ayah = last_chapter_ref.words[last_end].ayah
                 # Find the last word index that belongs to the same verse
-                verse_end = last_end
-                while (verse_end + 1 < last_chapter_ref.num_words
-                       and last_chapter_ref.words[verse_end + 1].ayah == last_ayah):
-                    verse_end += 1
+                verse_end = bisect_right(last_chapter_ref.word_ayahs, last_ayah) - 1
                 if last_end < verse_end:
                     gap_segments.add(last_matched)
                     gap_count = verse_end - last_end
@@ -1,17 +1,32 @@
 """
-Phoneme n-gram index: dataclass and cached loader.
+Phoneme n-gram index: dataclasses and cached loader.
+
+The index ships as a pickled PhonemeNgramIndex (dict of phoneme tuples).
+At runtime it is used in packed array form: every n-gram is encoded as one
+int64 key (phoneme ids bit-packed), keys are sorted for np.searchsorted, and
+positions are stored CSR-style. The arrays are derived from the pickle once
+and cached as .npy files next to it, so later loads are a handful of
+memory-mapped reads instead of unpickling millions of Python objects.
 """
 
-import pickle
+import json
+import os
+import shutil
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
-from config import NGRAM_INDEX_PATH
+from config import NGRAM_INDEX_ARRAYS_PATH, NGRAM_INDEX_PATH
+from src.core.mmap_pickle import file_signature, load_pickle_mmap
+
+_ARRAY_FIELDS = ("keys", "counts", "offsets", "pos_surah", "pos_ayah")
 
 
 @dataclass
 class PhonemeNgramIndex:
-    """Pre-computed n-gram index for the entire Quran."""
+    """Pre-computed n-gram index for the entire Quran (on-disk pickle format)."""
 
     # n-gram -> list of (surah, ayah) positions where it occurs
     ngram_positions: Dict[Tuple[str, ...], List[Tuple[int, int]]]
@@ -24,16 +39,168 @@ class PhonemeNgramIndex:
     total_ngrams: int
 
 
-_INDEX: Optional[PhonemeNgramIndex] = None
+@dataclass
+class PackedNgramIndex:
+    """Array form of PhonemeNgramIndex used for lookups."""
+
+    phoneme_ids: Dict[str, int]  # phoneme -> id packed into keys
+    bits: int                    # bits per phoneme id inside a key
+    keys: np.ndarray             # int64[K], sorted packed n-grams
+    counts: np.ndarray           # int32[K], total occurrences (rarity weighting)
+    offsets: np.ndarray          # int64[K+1], row k's positions are [offsets[k], offsets[k+1])
+    pos_surah: np.ndarray        # int16[P]
+    pos_ayah: np.ndarray         # int16[P]
+    ngram_size: int
+    total_ngrams: int
+
+    def __len__(self) -> int:
+        """Number of distinct n-grams in the index."""
+        return len(self.keys)
+
+    def encode(self, phonemes: Sequence[str]) -> np.ndarray:
+        """Phoneme ids as int64, -1 for phonemes that never occur in the index."""
+        ids = self.phoneme_ids
+        return np.fromiter((ids.get(p, -1) for p in phonemes), dtype=np.int64, count=len(phonemes))
+
+    def ngram_keys(self, phonemes: Sequence[str]) -> np.ndarray:
+        """Packed key of every n-gram window; -1 where the window has an unknown phoneme."""
+        ids = self.encode(phonemes)
+        n = self.ngram_size
+        m = len(ids) - n + 1
+        if m <= 0:
+            return np.empty(0, dtype=np.int64)
+        keys = np.zeros(m, dtype=np.int64)
+        valid = np.ones(m, dtype=bool)
+        for k in range(n):
+            window = ids[k:k + m]
+            keys = (keys << self.bits) | np.maximum(window, 0)
+            valid &= window >= 0
+        keys[~valid] = -1
+        return keys
+
+    def lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Row index for each packed key, -1 when the n-gram is not in the index."""
+        if len(keys) == 0 or len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = (self.keys[rows] == keys) & (keys >= 0)
+        return np.where(found, rows, -1)
+
+
+def pack_ngram_index(index: PhonemeNgramIndex) -> PackedNgramIndex:
+    """Convert the pickled dict index into sorted packed-key arrays.
+
+    Positions keep their original per-n-gram order so vote accumulation sums
+    in the same order as the dict-based implementation did.
+    """
+    vocab = sorted({p for ng in index.ngram_positions for p in ng})
+    phoneme_ids = {p: i for i, p in enumerate(vocab)}
+    bits = max(1, (len(vocab) - 1).bit_length())
+    n = index.ngram_size
+    if bits * n > 63:
+        raise ValueError(f"{n}-grams over {len(vocab)} phonemes do not fit in an int64 key")
 
+    packed = []
+    for ng, positions in index.ngram_positions.items():
+        key = 0
+        for p in ng:
+            key = (key << bits) | phoneme_ids[p]
+        packed.append((key, index.ngram_counts[ng], positions))
+    packed.sort(key=lambda item: item[0])
 
-def get_ngram_index() -> PhonemeNgramIndex:
+    lengths = np.fromiter((len(pos) for _, _, pos in packed), dtype=np.int64, count=len(packed))
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = [sa for _, _, pos in packed for sa in pos]
+
+    return PackedNgramIndex(
+        phoneme_ids=phoneme_ids,
+        bits=bits,
+        keys=np.fromiter((k for k, _, _ in packed), dtype=np.int64, count=len(packed)),
+        counts=np.fromiter((c for _, c, _ in packed), dtype=np.int32, count=len(packed)),
+        offsets=offsets,
+        pos_surah=np.array([s for s, _ in flat], dtype=np.int16),
+        pos_ayah=np.array([a for _, a in flat], dtype=np.int16),
+        ngram_size=n,
+        total_ngrams=index.total_ngrams,
+    )
+
+
+def save_packed_ngram_index(packed: PackedNgramIndex, out_dir: Path, source_signature: str) -> None:
+    """Write the arrays as .npy files plus meta.json, replacing out_dir atomically."""
+    tmp_dir = out_dir.with_name(f"{out_dir.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    try:
+        tmp_dir.mkdir(parents=True)
+        for field in _ARRAY_FIELDS:
+            np.save(tmp_dir / f"{field}.npy", getattr(packed, field))
+        vocab = sorted(packed.phoneme_ids, key=packed.phoneme_ids.get)
+        meta = {
+            "source": source_signature,
+            "ngram_size": packed.ngram_size,
+            "total_ngrams": packed.total_ngrams,
+            "bits": packed.bits,
+            "vocab": vocab,
+        }
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.replace(tmp_dir, out_dir)
+    finally:
+        # No-op after a successful replace; clears a half-written tmp dir otherwise
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def load_packed_ngram_index(out_dir: Path, source_signature: str) -> Optional[PackedNgramIndex]:
+    """Memory-map the cached arrays; None if missing or built from a different pickle."""
+    try:
+        meta = json.loads((out_dir / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("source") != source_signature:
+            return None
+        arrays = {f: np.load(out_dir / f"{f}.npy", mmap_mode="r") for f in _ARRAY_FIELDS}
+    except (OSError, ValueError):
+        return None
+    return PackedNgramIndex(
+        phoneme_ids={p: i for i, p in enumerate(meta["vocab"])},
+        bits=meta["bits"],
+        ngram_size=meta["ngram_size"],
+        total_ngrams=meta["total_ngrams"],
+        **arrays,
+    )
+
+
+def convert_ngram_index(
+    pkl_path: Path = NGRAM_INDEX_PATH,
+    out_dir: Path = NGRAM_INDEX_ARRAYS_PATH,
+) -> PackedNgramIndex:
+    """Build the array cache from the pickle (also run on demand by get_ngram_index)."""
+    signature = file_signature(pkl_path)
+    packed = pack_ngram_index(load_pickle_mmap(pkl_path))
+    try:
+        save_packed_ngram_index(packed, out_dir, signature)
+    except OSError as e:
+        # Read-only installs still work, they just rebuild on every start
+        print(f"[NGRAM] Could not write array cache to {out_dir}: {e}")
+    return packed
+
+
+_INDEX: Optional[PackedNgramIndex] = None
+
+
+def get_ngram_index() -> PackedNgramIndex:
     """Get or load the phoneme n-gram index."""
     global _INDEX
     if _INDEX is None:
         print(f"[NGRAM] Loading index from {NGRAM_INDEX_PATH}...")
-        with open(NGRAM_INDEX_PATH, "rb") as f:
-            _INDEX = pickle.load(f)
-        print(f"[NGRAM] Loaded: {len(_INDEX.ngram_positions)} unique {_INDEX.ngram_size}-grams, "
+        _INDEX = load_packed_ngram_index(NGRAM_INDEX_ARRAYS_PATH, file_signature(NGRAM_INDEX_PATH))
+        if _INDEX is None:
+            print("[NGRAM] Array cache missing or stale, converting pickle...")
+            _INDEX = convert_ngram_index()
+        print(f"[NGRAM] Loaded: {len(_INDEX)} unique {_INDEX.ngram_size}-grams, "
               f"{_INDEX.total_ngrams} total occurrences")
     return _INDEX
+
+
+if __name__ == "__main__":
+    # One-off migration: python -m src.alignment.ngram_index
+    converted = convert_ngram_index()
+    print(f"[NGRAM] Wrote {len(converted)} n-grams to {NGRAM_INDEX_ARRAYS_PATH}")
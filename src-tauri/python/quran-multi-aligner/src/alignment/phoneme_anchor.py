@@ -8,14 +8,22 @@ Then we find the best contiguous run of voted ayahs in that surah and
 anchor to the first ayah of that run.
 """
 
+import heapq
+from bisect import bisect_left
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from config import ANCHOR_DEBUG, ANCHOR_RARITY_WEIGHTING, ANCHOR_RUN_TRIM_RATIO, ANCHOR_TOP_CANDIDATES
-from .ngram_index import PhonemeNgramIndex
+from .ngram_index import PackedNgramIndex
 from .phoneme_matcher import ChapterReference
 from src.core.debug_collector import get_debug_collector
 
+# (surah, ayah) packed as surah << _AYAH_BITS | ayah; the longest surah has 286 ayahs
+_AYAH_BITS = 9
+_AYAH_MASK = (1 << _AYAH_BITS) - 1
+
 
 def _find_best_contiguous_run(
     ayah_weights: Dict[int, float],
@@ -74,9 +82,55 @@ def _find_best_contiguous_run(
     return (best_start, best_end, best_weight)
 
 
+def _accumulate_votes(
+    ngram_index: PackedNgramIndex,
+    rows: np.ndarray,
+) -> Dict[Tuple[int, int], float]:
+    """
+    Sum n-gram weights per (surah, ayah) over the index rows that matched.
+
+    Gathers every row's CSR position slice in one pass and accumulates with
+    np.add.at, which adds in the same order as a per-position loop would.
+    The dict is built in first-vote order so downstream tie-breaks (stable
+    sorts over votes.items()) are unchanged.
+
+    Args:
+        ngram_index: Pre-built n-gram index
+        rows: Matched row indices, in ASR n-gram order
+
+    Returns:
+        {(surah, ayah): vote_weight}
+    """
+    lo = ngram_index.offsets[rows]
+    lengths = ngram_index.offsets[rows + 1] - lo
+    total = int(lengths.sum())
+    if total == 0:
+        return {}
+
+    # Position index of every vote: row k contributes offsets[k] .. offsets[k+1]-1
+    slice_starts = np.repeat(lo - (np.cumsum(lengths) - lengths), lengths)
+    positions = slice_starts + np.arange(total)
+
+    if ANCHOR_RARITY_WEIGHTING:
+        row_weights = 1.0 / ngram_index.counts[rows].astype(np.float64)
+    else:
+        row_weights = np.ones(len(rows), dtype=np.float64)
+    weights = np.repeat(row_weights, lengths)
+
+    pair_keys = (ngram_index.pos_surah[positions].astype(np.int64) << _AYAH_BITS) | ngram_index.pos_ayah[positions]
+    pairs, first_seen, inverse = np.unique(pair_keys, return_index=True, return_inverse=True)
+    sums = np.zeros(len(pairs), dtype=np.float64)
+    np.add.at(sums, inverse, weights)
+
+    return {
+        (int(pairs[i] >> _AYAH_BITS), int(pairs[i] & _AYAH_MASK)): float(sums[i])
+        for i in np.argsort(first_seen, kind="stable")
+    }
+
+
 def find_anchor_by_voting(
     phoneme_texts: List[List[str]],
-    ngram_index: PhonemeNgramIndex,
+    ngram_index: PackedNgramIndex,
     n_segments: int,
 ) -> Tuple[int, int]:
     """
@@ -115,11 +169,9 @@ def find_anchor_by_voting(
         if combined:
             print(f"  ASR phonemes: {' '.join(combined[:30])}{'...' if len(combined) > 30 else ''}")
 
-    # Extract n-grams from ASR
-    asr_ngrams = [
-        tuple(combined[i : i + n])
-        for i in range(len(combined) - n + 1)
-    ]
+    # Extract n-grams from ASR as packed keys and resolve them to index rows
+    asr_ngrams = ngram_index.ngram_keys(combined)
+    rows = ngram_index.lookup(asr_ngrams)
 
     if ANCHOR_DEBUG:
         print(f"  ASR n-grams extracted: {len(asr_ngrams)}")
@@ -127,20 +179,10 @@ def find_anchor_by_voting(
     # =========================================================================
     # Phase 1: Raw voting — accumulate (surah, ayah) votes
     # =========================================================================
-    votes: Dict[Tuple[int, int], float] = defaultdict(float)
-    matched_ngrams = 0
-    missed_ngrams = 0
-
-    for ng in asr_ngrams:
-        if ng not in ngram_index.ngram_positions:
-            missed_ngrams += 1
-            continue
-
-        matched_ngrams += 1
-        weight = (1.0 / ngram_index.ngram_counts[ng]) if ANCHOR_RARITY_WEIGHTING else 1.0
-
-        for surah, ayah in ngram_index.ngram_positions[ng]:
-            votes[(surah, ayah)] += weight
+    matched_rows = rows[rows >= 0]
+    matched_ngrams = len(matched_rows)
+    missed_ngrams = len(rows) - matched_ngrams
+    votes = _accumulate_votes(ngram_index, matched_rows)
 
     if ANCHOR_DEBUG:
         print(f"  N-grams matched: {matched_ngrams}/{len(asr_ngrams)} "
@@ -170,11 +212,14 @@ def find_anchor_by_voting(
     # Phase 1b: Pre-filter surahs by total weight
     # =========================================================================
     surah_totals: Dict[int, float] = defaultdict(float)
+    surah_ayah_weights: Dict[int, Dict[int, float]] = defaultdict(dict)
     for (s, a), w in votes.items():
         surah_totals[s] += w
+        surah_ayah_weights[s][a] = w
 
-    ranked_surahs = sorted(surah_totals.items(), key=lambda kv: kv[1], reverse=True)
-    top_surahs = [s for s, _ in ranked_surahs[:ANCHOR_TOP_CANDIDATES]]
+    # nlargest keeps sorted(..., reverse=True)'s tie order, so ties still go to the earliest voted surah
+    ranked_surahs = heapq.nlargest(ANCHOR_TOP_CANDIDATES, surah_totals.items(), key=lambda kv: kv[1])
+    top_surahs = [s for s, _ in ranked_surahs]
 
     # =========================================================================
     # Phase 2: Evaluate best contiguous run for each candidate surah
@@ -184,15 +229,14 @@ def find_anchor_by_voting(
     best_run_end = 0
     best_run_weight = -1.0
     candidate_results: List[Tuple[int, float, int, int, float]] = []  # (surah, total, run_start, run_end, run_weight)
+    # The ranking table is only read by the debug print and the debug collector
+    _dc = get_debug_collector()
+    keep_candidates = ANCHOR_DEBUG or _dc is not None
 
     for s in top_surahs:
-        ayah_weights: Dict[int, float] = {}
-        for (sv, av), w in votes.items():
-            if sv == s:
-                ayah_weights[av] = w
-
-        run_start, run_end, run_weight = _find_best_contiguous_run(ayah_weights)
-        candidate_results.append((s, surah_totals[s], run_start, run_end, run_weight))
+        run_start, run_end, run_weight = _find_best_contiguous_run(surah_ayah_weights[s])
+        if keep_candidates:
+            candidate_results.append((s, surah_totals[s], run_start, run_end, run_weight))
 
         if run_weight > best_run_weight:
             best_run_weight = run_weight
@@ -211,7 +255,6 @@ def find_anchor_by_voting(
         print(f"\n  RESULT: Surah {best_surah}, Ayah {best_run_start} (start of best run)")
         print(f"{'=' * 60}\n")
 
-    _dc = get_debug_collector()
     if _dc is not None:
         _dc.anchor = {
             "segments_used": segments_used,
@@ -245,7 +288,6 @@ def verse_to_word_index(chapter_ref: ChapterReference, ayah: int) -> int:
     Returns:
         Word index into chapter_ref.words, or 0 if not found
     """
-    for idx, word in enumerate(chapter_ref.words):
-        if word.ayah == ayah:
-            return idx
-    return 0
+    ayahs = chapter_ref.word_ayahs
+    idx = bisect_left(ayahs, ayah)
+    return idx if idx < len(ayahs) and ayahs[idx] == ayah else 0
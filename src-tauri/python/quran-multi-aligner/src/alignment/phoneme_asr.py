@@ -7,24 +7,17 @@ import numpy as np
 from typing import List
 
 from config import (
-    PHONEME_ASR_MODELS, PHONEME_ASR_MODEL_DEFAULT, DTYPE, CPU_DTYPE,
-    IS_HF_SPACE, TORCH_COMPILE,
+    PHONEME_ASR_MODELS, PHONEME_ASR_MODEL_DEFAULT, ASR_QUANT,
+    IS_HF_SPACE, TORCH_COMPILE, TORCH_COMPILE_MODE, TORCH_COMPILE_DYNAMIC,
     BATCHING_STRATEGY, INFERENCE_BATCH_SIZE,
     MAX_BATCH_SECONDS, MAX_BATCH_SECONDS_CPU, MAX_PAD_WASTE, MIN_BATCH_SIZE,
 )
+from ..core.torch_dtype import CPU_TORCH_DTYPE, gpu_dtype
 from ..core.zero_gpu import ZERO_GPU_AVAILABLE, is_user_forced_cpu, model_device_lock
 
 
 _cache = {}  # model_name -> {"model": Model, "processor": Processor, "device": str}
 
-_TORCH_DTYPE = torch.float16 if DTYPE == "float16" else torch.float32
-_CPU_TORCH_DTYPE = (
-    torch.bfloat16 if CPU_DTYPE in ("bfloat16", "bf16")
-    else torch.float16 if CPU_DTYPE == "float16"
-    else torch.float32
-)
-
-
 def _get_hf_token():
     """Get HF token from env var or stored login."""
     token = os.environ.get("HF_TOKEN")
@@ -40,20 +33,20 @@ def _get_hf_token():
 def _get_device_and_dtype():
     """Get the best available device and dtype.
 
-    CPU dtype is governed by CPU_DTYPE env var (default fp32). fp16 is only
+    CPU dtype is governed by CPU_DTYPE env var (default bf16). fp16 is only
     safe on CPUs with AVX512_FP16 (e.g. zero-a10g AMD EPYC) — on cpu-basic
     workers without AVX512_FP16 it falls back to scalar/copy-cast ops that
-    can be 10-100× slower than fp32. GPU path re-casts to _TORCH_DTYPE when
+    can be 10-100× slower than fp32. GPU path re-casts to gpu_dtype() when
     transitioning to CUDA.
 
     On HF Spaces with ZeroGPU, returns CPU to defer CUDA init
     until inside a @gpu_decorator function.
     """
     if IS_HF_SPACE or ZERO_GPU_AVAILABLE:
-        return torch.device("cpu"), _CPU_TORCH_DTYPE
+        return torch.device("cpu"), CPU_TORCH_DTYPE
     if torch.cuda.is_available():
-        return torch.device("cuda"), _TORCH_DTYPE
-    return torch.device("cpu"), _CPU_TORCH_DTYPE
+        return torch.device("cuda"), gpu_dtype()
+    return torch.device("cpu"), CPU_TORCH_DTYPE
 
 
 def load_phoneme_asr(model_name=PHONEME_ASR_MODEL_DEFAULT):
@@ -93,8 +86,17 @@ def load_phoneme_asr(model_name=PHONEME_ASR_MODEL_DEFAULT):
         )
         model.to(device, dtype=dtype)
         model.eval()
-        if TORCH_COMPILE and not (IS_HF_SPACE or ZERO_GPU_AVAILABLE):
-            model = torch.compile(model, mode="reduce-overhead")
+        quantized = (
+            ASR_QUANT == "int8_dynamic" and model_name == "Base"
+            and device.type == "cpu" and not (IS_HF_SPACE or ZERO_GPU_AVAILABLE)
+        )
+        if quantized:
+            # Dynamic quant kernels take fp32 activations; the model can't move to CUDA afterwards
+            model = torch.ao.quantization.quantize_dynamic(
+                model.float(), {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif TORCH_COMPILE and not (IS_HF_SPACE or ZERO_GPU_AVAILABLE):
+            model = torch.compile(model, mode=TORCH_COMPILE_MODE, dynamic=TORCH_COMPILE_DYNAMIC)
 
         processor = AutoProcessor.from_pretrained(model_path, token=hf_token)
 
@@ -104,7 +106,7 @@ def load_phoneme_asr(model_name=PHONEME_ASR_MODEL_DEFAULT):
             "device": device.type,
         }
 
-        print(f"Phoneme ASR ({model_name}) loaded on {device}")
+        print(f"Phoneme ASR ({model_name}) loaded on {device}{' (int8 dynamic)' if quantized else ''}")
         return model, processor
 
 
@@ -132,7 +134,7 @@ def move_phoneme_asr_to_gpu(model_name=None):
             model = entry["model"]
             if next(model.parameters()).device.type != "cuda":
                 try:
-                    entry["model"] = model.to(device, dtype=_TORCH_DTYPE)
+                    entry["model"] = model.to(device, dtype=gpu_dtype())
                     entry["device"] = "cuda"
                     print(f"[PHONEME ASR] Moved '{name}' to CUDA")
                 except RuntimeError as e:
@@ -159,43 +161,33 @@ def invalidate_asr_cache(model_name=None):
             print(f"[PHONEME ASR] Cache invalidated: {names}")
 
 
-def ids_to_phoneme_list(ids: List[int], tokenizer, pad_id: int) -> List[str]:
+def ids_to_phoneme_list(ids: np.ndarray, tokenizer, pad_id: int) -> List[str]:
     """
     Convert token IDs to phoneme list with CTC collapse.
 
     CTC decoding:
-    1. Remove pad/blank tokens
-    2. Collapse consecutive duplicates
+    1. Collapse consecutive duplicates
+    2. Remove pad/blank tokens
     3. Filter out word delimiter "|"
-    """
-    # Convert all IDs to tokens first (do not skip any yet)
-    toks = tokenizer.convert_ids_to_tokens(ids)
 
-    if not toks:
+    Collapsing on ids first is equivalent to the token-level loop (a pad or
+    "|" between two equal ids still separates them) and leaves only the run
+    heads to convert to tokens.
+    """
+    ids = np.asarray(ids)
+    if ids.size == 0:
         return []
 
+    # CTC collapse: keep the first frame of every run of equal ids
+    keep = np.empty(ids.shape[0], dtype=bool)
+    keep[0] = True
+    np.not_equal(ids[1:], ids[:-1], out=keep[1:])
+    toks = tokenizer.convert_ids_to_tokens(ids[keep].tolist())
+
     # Get the actual token string for pad
     pad_tok = tokenizer.convert_ids_to_tokens([pad_id])[0] if pad_id is not None else "[PAD]"
 
-    # CTC collapse: remove consecutive duplicates and special tokens
-    collapsed: List[str] = []
-    prev = None
-    for t in toks:
-        # Skip pad/blank token
-        if t == pad_tok:
-            prev = t
-            continue
-        # Skip word delimiter
-        if t == "|":
-            prev = t
-            continue
-        # Skip consecutive duplicates (CTC collapse)
-        if t == prev:
-            continue
-        collapsed.append(t)
-        prev = t
-
-    return collapsed
+    return [t for t in toks if t != pad_tok and t != "|"]
 
 
 def build_batches_naive(sorted_indices: List[int], batch_size: int) -> List[List[int]]:
@@ -307,11 +299,11 @@ def _transcribe_batch_pytorch(
 
         # CTC greedy decode
         t_decode_start = time.time()
-        predicted_ids = torch.argmax(logits, dim=-1)
+        # One device-to-host copy for the whole batch instead of one per row
+        predicted_ids = torch.argmax(logits, dim=-1).cpu().numpy()
 
         for j in range(predicted_ids.shape[0]):
-            ids_list = predicted_ids[j].cpu().tolist()
-            phoneme_list = ids_to_phoneme_list(ids_list, tokenizer, pad_id)
+            phoneme_list = ids_to_phoneme_list(predicted_ids[j], tokenizer, pad_id)
             results[batch_idx[j]] = phoneme_list
         decode_time = time.time() - t_decode_start
 
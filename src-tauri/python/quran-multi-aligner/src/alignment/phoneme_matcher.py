@@ -5,8 +5,8 @@ This module implements the core alignment algorithm for matching ASR phoneme
 sequences to reference Quranic text phonemes with word-boundary constraints.
 """
 
-import json
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 
 from config import (
@@ -28,6 +28,7 @@ from config import (
 )
 
 from .phonemizer_utils import get_phonemizer, phonemize_with_stops
+from ..core.json_data import load_json
 
 
 # =============================================================================
@@ -43,8 +44,7 @@ def _load_substitution_costs() -> Dict[Tuple[str, str], float]:
     path = DATA_PATH / "phoneme_sub_costs.json"
     if not path.exists():
         return {}
-    with open(path) as f:
-        raw = json.load(f)
+    raw = load_json(path)
     costs = {}
     for key, section in raw.items():
         if key == "_meta":
@@ -114,6 +114,11 @@ class ChapterReference:
     def num_words(self) -> int:
         return len(self.words)
 
+    @cached_property
+    def word_ayahs(self) -> List[int]:
+        """Ayah number of each word (non-decreasing), built once per chapter for bisecting."""
+        return [w.ayah for w in self.words]
+
 
 @dataclass
 class AlignmentResult:
@@ -633,8 +638,9 @@ def align_segment(
 
     if prefix_phonemes is not None:
         prefix_len = len(prefix_phonemes)
-        R = list(prefix_phonemes) + list(R)
-        R_phone_to_word = [BASMALA_SENTINEL] * prefix_len + list(R_phone_to_word)
+        # R / R_phone_to_word are fresh slices, so one concatenation each suffices
+        R = prefix_phonemes + R
+        R_phone_to_word = [BASMALA_SENTINEL] * prefix_len + R_phone_to_word
 
     n = len(R)
 
@@ -651,10 +657,11 @@ def align_segment(
     # Record DP trace for the debug collector / v3 log row.
     # Captured up front so any failure path can still emit the window state
     # the DP actually saw. j_start/best_j/basmala_consumed get filled in below
-    # on the success path.
+    # on the success path. R / R_phone_to_word are this call's own slices and
+    # are never mutated, so they are stored without copying.
     timing['dp_trace'] = {
-        'R': list(R),
-        'R_phone_to_word': list(R_phone_to_word),
+        'R': R,
+        'R_phone_to_word': R_phone_to_word,
         'win_start': win_start,
         'win_end': win_end,
         'j_start': None,
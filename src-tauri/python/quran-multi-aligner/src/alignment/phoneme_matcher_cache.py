@@ -3,16 +3,84 @@ Cache for ChapterReference objects.
 
 Loads pre-built chapter references from a pickle file (built by
 scripts/build_phoneme_cache.py) to avoid runtime phonemization.
+
+Long-running servers preload all 114 chapters. One-shot callers (the desktop
+wrapper aligns a single recording per process) load lazily instead: the full
+pickle is split once into per-surah files under PHONEME_CACHE_DIR, after which
+a request only unpickles the surahs it actually aligns against.
 """
 
+import os
 import pickle
-from typing import TYPE_CHECKING
+import shutil
+import threading
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .phoneme_matcher import ChapterReference
 
 # Global cache: surah number -> ChapterReference
 _chapter_cache: dict[int, "ChapterReference"] = {}
+_load_lock = threading.Lock()
+
+_SPLIT_STAMP = "source"
+
+
+def _source_signature() -> str:
+    """Size and mtime of the full phoneme cache pickle, stamped into the split dir."""
+    from config import PHONEME_CACHE_PATH
+    from src.core.mmap_pickle import file_signature
+    return file_signature(PHONEME_CACHE_PATH)
+
+
+def _split_is_current() -> bool:
+    """True when the split cache was built from the current full pickle."""
+    from config import PHONEME_CACHE_DIR
+    try:
+        return (PHONEME_CACHE_DIR / _SPLIT_STAMP).read_text(encoding="utf-8") == _source_signature()
+    except OSError:
+        return False
+
+
+def _write_split(chapters: dict[int, "ChapterReference"], signature: str) -> None:
+    """Write one pickle per surah, replacing PHONEME_CACHE_DIR atomically."""
+    from config import PHONEME_CACHE_DIR
+    tmp_dir = PHONEME_CACHE_DIR.with_name(f"{PHONEME_CACHE_DIR.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    try:
+        tmp_dir.mkdir(parents=True)
+        for surah, ref in chapters.items():
+            with open(tmp_dir / f"surah_{surah:03d}.pkl", "wb") as f:
+                pickle.dump(ref, f, protocol=pickle.HIGHEST_PROTOCOL)
+        (tmp_dir / _SPLIT_STAMP).write_text(signature, encoding="utf-8")
+        shutil.rmtree(PHONEME_CACHE_DIR, ignore_errors=True)
+        os.replace(tmp_dir, PHONEME_CACHE_DIR)
+    finally:
+        # No-op after a successful replace; clears a half-written tmp dir otherwise
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _load_from_cache_files(surah: int) -> Optional["ChapterReference"]:
+    """Load one surah from the split cache, splitting the full pickle first if needed."""
+    from config import PHONEME_CACHE_DIR, PHONEME_CACHE_PATH
+    from src.core.mmap_pickle import load_pickle_mmap
+
+    if not PHONEME_CACHE_PATH.exists():
+        return None
+    if _split_is_current():
+        path = PHONEME_CACHE_DIR / f"surah_{surah:03d}.pkl"
+        return load_pickle_mmap(path) if path.exists() else None
+
+    # Paying for the full load anyway: keep every chapter and split for next time
+    signature = _source_signature()
+    print(f"[CACHE] Splitting {PHONEME_CACHE_PATH} into {PHONEME_CACHE_DIR}...")
+    loaded: dict[int, "ChapterReference"] = load_pickle_mmap(PHONEME_CACHE_PATH)
+    _chapter_cache.update(loaded)
+    try:
+        _write_split(loaded, signature)
+    except OSError as e:
+        print(f"[CACHE] Could not write per-surah cache: {e}")
+    return loaded.get(surah)
 
 
 def get_chapter_reference(surah: int) -> "ChapterReference":
@@ -26,22 +94,28 @@ def get_chapter_reference(surah: int) -> "ChapterReference":
         ChapterReference with pre-built phoneme data
     """
     if surah not in _chapter_cache:
-        # Fallback: build at runtime if cache wasn't preloaded
-        from .phoneme_matcher import build_chapter_reference
-        print(f"[CACHE] WARNING: Building reference for Surah {surah} at runtime "
-              "(phoneme cache not loaded — run scripts/build_phoneme_cache.py)")
-        _chapter_cache[surah] = build_chapter_reference(surah)
+        with _load_lock:
+            if surah in _chapter_cache:
+                return _chapter_cache[surah]
+            ref = _load_from_cache_files(surah)
+            if ref is None:
+                # Fallback: build at runtime if no cache file is available
+                from .phoneme_matcher import build_chapter_reference
+                print(f"[CACHE] WARNING: Building reference for Surah {surah} at runtime "
+                      "(phoneme cache not loaded — run scripts/build_phoneme_cache.py)")
+                ref = build_chapter_reference(surah)
+            _chapter_cache[surah] = ref
     return _chapter_cache[surah]
 
 
 def preload_all_chapters() -> None:
     """Load all 114 chapter references from the pre-built cache file."""
     from config import PHONEME_CACHE_PATH
+    from src.core.mmap_pickle import load_pickle_mmap
 
     if PHONEME_CACHE_PATH.exists():
         print(f"[CACHE] Loading phoneme cache from {PHONEME_CACHE_PATH}...")
-        with open(PHONEME_CACHE_PATH, "rb") as f:
-            loaded: dict[int, "ChapterReference"] = pickle.load(f)
+        loaded: dict[int, "ChapterReference"] = load_pickle_mmap(PHONEME_CACHE_PATH)
         _chapter_cache.update(loaded)
         print(f"[CACHE] Loaded {len(loaded)} chapters from cache")
     else:
@@ -35,6 +35,9 @@ SPECIAL_PHONEMES = {
 # Combined = Isti'adha + Basmala (for detecting both in one segment)
 COMBINED_PHONEMES = SPECIAL_PHONEMES["Isti'adha"] + SPECIAL_PHONEMES["Basmala"]
 
+# References tried on segment 0 by detect_inter_chapter_specials
+_INTER_CHAPTER_REFS = (COMBINED_PHONEMES, SPECIAL_PHONEMES["Isti'adha"], SPECIAL_PHONEMES["Basmala"])
+
 # Arabic text for display
 SPECIAL_TEXT = {
     "Isti'adha": "أَعُوذُ بِٱللَّهِ مِنَ الشَّيْطَانِ الرَّجِيم",
@@ -359,6 +362,16 @@ def detect_inter_chapter_specials(
 
     seg0_phonemes = phoneme_texts[0]
 
+    # Edit distance is at least the length difference, so a segment whose
+    # length is too far from every special cannot match any of them
+    m = len(seg0_phonemes)
+    if all(
+        abs(m - len(ref)) / max(m, len(ref)) > MAX_SPECIAL_EDIT_DISTANCE
+        for ref in _INTER_CHAPTER_REFS
+    ):
+        print(f"[INTER-CHAPTER] No special segments detected ({m} phonemes, length mismatch)")
+        return [], 0
+
     # 1. Try COMBINED (Isti'adha + Basmala in one segment)
     combined_dist = phoneme_edit_distance(seg0_phonemes, COMBINED_PHONEMES)
     if combined_dist <= MAX_SPECIAL_EDIT_DISTANCE:
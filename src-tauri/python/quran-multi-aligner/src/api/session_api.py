@@ -6,12 +6,14 @@ re-uploads and re-inference.
 """
 
 import hashlib
+import heapq
 import json
 import math
 import os
 import pickle
 import re
 import shutil
+import threading
 import time
 import uuid
 
@@ -35,6 +37,13 @@ from src.core.usage_logger import (
 _last_cleanup_time = 0.0
 _CLEANUP_INTERVAL = 1800  # sweep at most every 30 min
 
+# Min-heap of (created_at, audio_id) so a sweep only touches expired sessions.
+# Seeded by one directory scan on the first sweep (sessions from a previous
+# process), then fed by create_session().
+_expiry_heap: list[tuple[float, str]] = []
+_expiry_heap_seeded = False
+_expiry_lock = threading.Lock()
+
 _VALID_ID = re.compile(r"^[0-9a-f]{32}$")
 _VALID_MODELS = set(PHONEME_ASR_MODELS.keys())
 
@@ -86,21 +95,39 @@ def _is_expired(created_at: float) -> bool:
     return (time.time() - created_at) > SESSION_EXPIRY_SECONDS
 
 
-def _sweep_expired():
-    """Delete expired session directories (runs at most every 30 min)."""
-    global _last_cleanup_time
-    now = time.time()
-    if now - _last_cleanup_time < _CLEANUP_INTERVAL:
-        return
-    _last_cleanup_time = now
+def _seed_expiry_heap():
+    """Scan SESSION_DIR once: drop expired/broken sessions, queue the rest."""
     if not SESSION_DIR.exists():
         return
     for entry in SESSION_DIR.iterdir():
         if not entry.is_dir():
             continue
         ts_file = entry / "created_at"
-        if not ts_file.exists() or _is_expired(float(ts_file.read_text())):
+        try:
+            created_at = float(ts_file.read_text())
+        except (OSError, ValueError):
+            created_at = None
+        if created_at is None or _is_expired(created_at):
             shutil.rmtree(entry, ignore_errors=True)
+        else:
+            heapq.heappush(_expiry_heap, (created_at, entry.name))
+
+
+def _sweep_expired():
+    """Delete expired session directories (runs at most every 30 min)."""
+    global _last_cleanup_time, _expiry_heap_seeded
+    now = time.time()
+    if now - _last_cleanup_time < _CLEANUP_INTERVAL:
+        return
+    _last_cleanup_time = now
+    with _expiry_lock:
+        if not _expiry_heap_seeded:
+            _expiry_heap_seeded = True
+            _seed_expiry_heap()
+            return
+        while _expiry_heap and _is_expired(_expiry_heap[0][0]):
+            _, audio_id = heapq.heappop(_expiry_heap)
+            shutil.rmtree(_session_dir(audio_id), ignore_errors=True)
 
 
 def _intervals_hash(intervals) -> str:
@@ -138,7 +165,10 @@ def create_session(audio, speech_intervals, is_complete, intervals, model_name):
         json.dump(meta, f)
 
     # Timestamp file for cheap expiry checks during sweep
-    (path / "created_at").write_text(str(time.time()))
+    created_at = time.time()
+    (path / "created_at").write_text(str(created_at))
+    with _expiry_lock:
+        heapq.heappush(_expiry_heap, (created_at, audio_id))
 
     return audio_id
 
@@ -0,0 +1,23 @@
+"""Fast loading for the read-only JSON data files (Quran scripts, surah info, costs).
+
+The Quran script JSONs are several MB each and parsed on every cold start.
+orjson (installed with gradio) parses them from raw bytes several times faster
+than the stdlib decoder; `json` remains the fallback when it is unavailable.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Parse a UTF-8 JSON file, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
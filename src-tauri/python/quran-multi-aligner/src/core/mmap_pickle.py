@@ -0,0 +1,36 @@
+"""Memory-mapped pickle loading for the large pre-built data caches.
+
+`pickle.load(f)` pulls the file through buffered `read()` calls, copying every
+chunk into a temporary bytes object before the unpickler sees it. Mapping the
+file read-only and handing the mapping to `pickle.loads` lets the unpickler
+walk the OS page cache directly, so cold start is bounded by page-in rather
+than by read/copy overhead, and no second copy of the raw file is held while
+the objects are being built.
+
+`file_signature` is the staleness stamp the derived caches built from these
+pickles record, so they can tell when the source file has been replaced.
+"""
+
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Union
+
+
+def load_pickle_mmap(path: Union[str, Path]) -> Any:
+    """Unpickle *path* straight from a read-only memory map."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and filesystems without mmap support
+            return pickle.load(f)
+        with mapped:
+            return pickle.loads(mapped)
+
+
+def file_signature(path: Union[str, Path]) -> str:
+    """Return "size:mtime_ns" for *path*, used to detect a replaced source file."""
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
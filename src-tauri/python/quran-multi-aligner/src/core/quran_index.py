@@ -11,12 +11,12 @@ has spaces before stop signs. The DigitalKhatt font renders DK text correctly.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from config import QURAN_SCRIPT_PATH_COMPUTE, QURAN_SCRIPT_PATH_DISPLAY
+from .json_data import load_json
 
 
 # Verse marker prefix to filter out (end-of-ayah markers)
@@ -60,10 +60,8 @@ class QuranIndex:
         if display_path is None:
             display_path = QURAN_SCRIPT_PATH_DISPLAY
 
-        with open(compute_path, "r", encoding="utf-8") as f:
-            compute_data = json.load(f)
-        with open(display_path, "r", encoding="utf-8") as f:
-            display_data = json.load(f)
+        compute_data = load_json(compute_path)
+        display_data = load_json(display_path)
 
         words: list[WordInfo] = []
         word_lookup: dict[tuple[int, int, int], int] = {}
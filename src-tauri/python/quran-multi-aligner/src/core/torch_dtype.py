@@ -0,0 +1,29 @@
+"""Torch dtypes resolved from the DTYPE / CPU_DTYPE config strings.
+
+Shared by the segmenter and the phoneme ASR so both models land on the same
+precision for a given device.
+"""
+
+import torch
+
+from config import DTYPE, CPU_DTYPE
+
+
+def parse_torch_dtype(name: str) -> torch.dtype:
+    """Map a config dtype string to a torch dtype; unknown names mean float32."""
+    if name in ("bfloat16", "bf16"):
+        return torch.bfloat16
+    if name == "float16":
+        return torch.float16
+    return torch.float32
+
+
+TORCH_DTYPE = parse_torch_dtype(DTYPE)
+CPU_TORCH_DTYPE = parse_torch_dtype(CPU_DTYPE)
+
+
+def gpu_dtype() -> torch.dtype:
+    """CUDA dtype: DTYPE, except bf16 drops to fp16 on GPUs without native bf16 (e.g. Turing)."""
+    if TORCH_DTYPE is torch.bfloat16 and torch.cuda.get_device_capability()[0] < 8:
+        return torch.float16
+    return TORCH_DTYPE
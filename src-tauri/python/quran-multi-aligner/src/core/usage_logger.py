@@ -216,6 +216,8 @@ if _HAS_DEPS:
                     archive.name,
                     row_group_size=1,
                     write_page_index=True,
+                    compression="zstd",
+                    compression_level=3,
                 )
                 subdir = f"{self._subset}/" if self._subset else ""
                 self.api.upload_file(
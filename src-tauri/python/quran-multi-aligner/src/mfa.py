@@ -1,6 +1,7 @@
 import os
+import threading
 import gradio as gr
-from config import (MFA_SPACE_URL, MFA_TIMEOUT, MFA_PROGRESS_SEGMENT_RATE,
+from config import (MFA_SPACE_URL, MFA_TIMEOUT, MFA_MAX_CONNECTIONS, MFA_PROGRESS_SEGMENT_RATE,
                     MFA_METHOD, MFA_BEAM, MFA_RETRY_BEAM, MFA_SHARED_CMVN,
                     MFA_SPLIT_PADDING)
 
@@ -10,6 +11,36 @@ _SPECIAL_REFS = {"basmala", "isti'adha"}
 _BASMALA_TEXT = "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيم"
 _ISTIATHA_TEXT = "أَعُوذُ بِٱللَّهِ مِنَ الشَّيْطَانِ الرَّجِيم"
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Shared keep-alive HTTP session for the MFA Space.
+
+    Reusing pooled connections skips a TCP+TLS handshake on each of the
+    upload / submit / SSE calls of every request. Only connect errors are
+    retried, so an upload or submit is never sent twice.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=MFA_MAX_CONNECTIONS,
+                    max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _session = s
+    return _session
+
 
 def _mfa_upload_and_submit(refs, audio_paths,
                            method=MFA_METHOD, beam=MFA_BEAM, retry_beam=MFA_RETRY_BEAM,
@@ -27,7 +58,7 @@ def _mfa_upload_and_submit(refs, audio_paths,
         retry_beam: Retry beam width (default 40).
         padding: Gap-padding strategy ("forward", "symmetric", "none").
     """
-    import requests
+    session = _get_session()
 
     hf_token = os.environ.get("HF_TOKEN", "")
     headers = {}
@@ -43,7 +74,7 @@ def _mfa_upload_and_submit(refs, audio_paths,
         open_handles.append(fh)
         files_payload.append(("files", (os.path.basename(path), fh, "audio/wav")))
     try:
-        resp = requests.post(
+        resp = session.post(
             f"{base}/gradio_api/upload",
             headers=headers,
             files=files_payload,
@@ -67,7 +98,7 @@ def _mfa_upload_and_submit(refs, audio_paths,
     ]
 
     # Submit batch alignment (7 params: refs, files, method, beam, retry_beam, shared_cmvn, padding)
-    submit_resp = requests.post(
+    submit_resp = session.post(
         f"{base}/gradio_api/call/align_batch",
         headers={**headers, "Content-Type": "application/json"},
         json={"data": [refs, file_data_list, method, str(beam), str(retry_beam),
@@ -86,36 +117,35 @@ def _mfa_upload_and_submit(refs, audio_paths,
 
 def _mfa_wait_result(event_id, headers, base):
     """Wait for the MFA SSE stream and return parsed results list."""
-    import requests
     import json
 
-    sse_resp = requests.get(
+    with _get_session().get(
         f"{base}/gradio_api/call/align_batch/{event_id}",
         headers=headers,
         stream=True,
         timeout=MFA_TIMEOUT,
-    )
-    sse_resp.raise_for_status()
-
-    result_data = None
-    current_event = None
-    for line in sse_resp.iter_lines(decode_unicode=True):
-        if line and line.startswith("event: "):
-            current_event = line[7:]
-        elif line and line.startswith("data: "):
-            data_str = line[6:]
-            if current_event == "complete":
-                result_data = data_str
-            elif current_event == "error":
-                # Gradio 6.x may send null as error data; provide actionable message
-                if data_str.strip() in ("null", ""):
-                    raise RuntimeError(
-                        "MFA align_batch failed: Space returned null error. "
-                        "This usually means a parameter count mismatch or "
-                        "Gradio input validation failure. Check that the "
-                        "client sends all required parameters."
-                    )
-                raise RuntimeError(f"MFA align_batch SSE error: {data_str}")
+    ) as sse_resp:
+        sse_resp.raise_for_status()
+
+        result_data = None
+        current_event = None
+        for line in sse_resp.iter_lines(decode_unicode=True):
+            if line and line.startswith("event: "):
+                current_event = line[7:]
+            elif line and line.startswith("data: "):
+                data_str = line[6:]
+                if current_event == "complete":
+                    result_data = data_str
+                elif current_event == "error":
+                    # Gradio 6.x may send null as error data; provide actionable message
+                    if data_str.strip() in ("null", ""):
+                        raise RuntimeError(
+                            "MFA align_batch failed: Space returned null error. "
+                            "This usually means a parameter count mismatch or "
+                            "Gradio input validation failure. Check that the "
+                            "client sends all required parameters."
+                        )
+                    raise RuntimeError(f"MFA align_batch SSE error: {data_str}")
 
     if result_data is None:
         raise RuntimeError("No data received from MFA align_batch SSE stream")
@@ -26,8 +26,16 @@ def is_aoti_applied() -> bool:
 
 
 def _get_aoti_hub_filename():
-    """Generate Hub filename encoding min/max audio duration."""
-    return f"vad_aoti_{AOTI_MIN_AUDIO_MINUTES}min_{AOTI_MAX_AUDIO_MINUTES}min.pt2"
+    """Generate Hub filename encoding the audio range, torch version and GPU arch.
+
+    The artifact already covers every length in the range (dynamic T), but the
+    generated kernels are only valid for the torch build and CUDA arch that
+    produced them, so those are part of the key too.
+    """
+    torch_version = torch.__version__.split("+")[0]
+    major, minor = torch.cuda.get_device_capability()
+    return (f"vad_aoti_{AOTI_MIN_AUDIO_MINUTES}min_{AOTI_MAX_AUDIO_MINUTES}min"
+            f"_torch{torch_version}_sm{major}{minor}.pt2")
 
 
 def _try_load_aoti_from_hub(model):
@@ -2,7 +2,11 @@
 
 import torch
 
-from config import SEGMENTER_MODEL, DTYPE, CPU_DTYPE, IS_HF_SPACE, TORCH_COMPILE
+from config import (
+    SEGMENTER_MODEL, IS_HF_SPACE,
+    TORCH_COMPILE, TORCH_COMPILE_MODE, TORCH_COMPILE_DYNAMIC,
+)
+from ..core.torch_dtype import CPU_TORCH_DTYPE, gpu_dtype
 from ..core.zero_gpu import ZERO_GPU_AVAILABLE, is_user_forced_cpu, model_device_lock
 
 
@@ -39,27 +43,19 @@ def _log_env_once():
         print(f"[ENV] Failed to log env: {e}")
 
 
-_TORCH_DTYPE = torch.float16 if DTYPE == "float16" else torch.float32
-_CPU_TORCH_DTYPE = (
-    torch.bfloat16 if CPU_DTYPE in ("bfloat16", "bf16")
-    else torch.float16 if CPU_DTYPE == "float16"
-    else torch.float32
-)
-
-
 def _get_device_and_dtype():
     """Get the best available device and dtype.
 
-    CPU dtype is governed by CPU_DTYPE env var (default fp32). fp16 is only
+    CPU dtype is governed by CPU_DTYPE env var (default bf16). fp16 is only
     safe on CPUs with AVX512_FP16 (zero-a10g AMD EPYC); on cpu-basic workers
     without it fp16 can be 10-100× slower. GPU move path re-casts to
-    _TORCH_DTYPE when transitioning to CUDA.
+    gpu_dtype() when transitioning to CUDA.
     """
     if IS_HF_SPACE or ZERO_GPU_AVAILABLE:
-        return torch.device("cpu"), _CPU_TORCH_DTYPE
+        return torch.device("cpu"), CPU_TORCH_DTYPE
     if torch.cuda.is_available():
-        return torch.device("cuda"), _TORCH_DTYPE
-    return torch.device("cpu"), _CPU_TORCH_DTYPE
+        return torch.device("cuda"), gpu_dtype()
+    return torch.device("cpu"), CPU_TORCH_DTYPE
 
 
 def ensure_models_on_gpu(asr_model_name=None):
@@ -84,7 +80,7 @@ def ensure_models_on_gpu(asr_model_name=None):
         return 0.0
 
     device = torch.device("cuda")
-    dtype = _TORCH_DTYPE
+    dtype = gpu_dtype()
     move_start = time.time()
 
     with model_device_lock:
@@ -157,7 +153,7 @@ def load_segmenter():
             model.to(device, dtype=dtype)
             model.eval()
             if TORCH_COMPILE and not (IS_HF_SPACE or ZERO_GPU_AVAILABLE):
-                model = torch.compile(model, mode="reduce-overhead")
+                model = torch.compile(model, mode=TORCH_COMPILE_MODE, dynamic=TORCH_COMPILE_DYNAMIC)
 
             processor = AutoFeatureExtractor.from_pretrained(SEGMENTER_MODEL)
 
@@ -307,10 +307,10 @@ def restore_anim_settings(cached):
     is_custom = not preset
     verse_on = bool(cached.get("verseOnly", False))
     if preset:
-        op_prev = preset["prev_opacity"]
-        op_after = preset["after_opacity"]
-        w_prev = preset["prev_words"]
-        w_after = preset["after_words"]
+        op_prev = preset.prev_opacity
+        op_after = preset.after_opacity
+        w_prev = preset.prev_words
+        w_after = preset.after_words
     elif cached.get("custom"):
         c = cached["custom"]
         op_prev = c.get("prevOpacity", ANIM_OPACITY_PREV_DEFAULT)
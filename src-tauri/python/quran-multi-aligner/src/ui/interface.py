@@ -257,18 +257,18 @@ def _build_animation_settings(c):
                 scale=ANIM_STYLE_ROW_SCALES[3],
             )
         _is_custom = (ANIM_DISPLAY_MODE_DEFAULT == "Custom")
-        _preset = ANIM_PRESETS.get(ANIM_DISPLAY_MODE_DEFAULT, {})
+        _preset = ANIM_PRESETS.get(ANIM_DISPLAY_MODE_DEFAULT)
         with gr.Row():
             c.anim_opacity_prev_slider = gr.Slider(
                 minimum=0, maximum=1, step=ANIM_OPACITY_STEP,
-                value=_preset.get("prev_opacity", ANIM_OPACITY_PREV_DEFAULT),
+                value=_preset.prev_opacity if _preset else ANIM_OPACITY_PREV_DEFAULT,
                 label="Before Opacity",
                 interactive=_is_custom,
                 elem_id="anim-opacity-prev",
             )
             c.anim_opacity_after_slider = gr.Slider(
                 minimum=0, maximum=1, step=ANIM_OPACITY_STEP,
-                value=_preset.get("after_opacity", ANIM_OPACITY_AFTER_DEFAULT),
+                value=_preset.after_opacity if _preset else ANIM_OPACITY_AFTER_DEFAULT,
                 label="After Opacity",
                 interactive=_is_custom,
                 elem_id="anim-opacity-after",
@@ -276,13 +276,13 @@ def _build_animation_settings(c):
         with gr.Row():
             c.anim_window_prev_slider = gr.Slider(
                 minimum=ANIM_WINDOW_PREV_MIN, maximum=ANIM_WINDOW_PREV_MAX, step=1,
-                value=_preset.get("prev_words", ANIM_WINDOW_PREV_DEFAULT),
+                value=_preset.prev_words if _preset else ANIM_WINDOW_PREV_DEFAULT,
                 label="Before Words", elem_id="anim-window-prev",
                 interactive=_is_custom,
             )
             c.anim_window_after_slider = gr.Slider(
                 minimum=ANIM_WINDOW_AFTER_MIN, maximum=ANIM_WINDOW_AFTER_MAX, step=1,
-                value=_preset.get("after_words", ANIM_WINDOW_AFTER_DEFAULT),
+                value=_preset.after_words if _preset else ANIM_WINDOW_AFTER_DEFAULT,
                 label="After Words", elem_id="anim-window-after",
                 interactive=_is_custom,
             )
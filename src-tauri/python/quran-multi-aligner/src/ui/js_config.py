@@ -20,7 +20,7 @@ def build_js_head(surah_ligatures: dict) -> str:
     """Return a <script> block with Python config globals and both JS files."""
     config_lines = [
         f"window.SURAH_LIGATURES = {json.dumps(surah_ligatures)};",
-        f"window.ANIM_PRESETS = {json.dumps(ANIM_PRESETS)};",
+        f"window.ANIM_PRESETS = {json.dumps({name: p._asdict() for name, p in ANIM_PRESETS.items()})};",
         f"window.ANIM_WINDOW_PREV_MAX = {ANIM_WINDOW_PREV_MAX};",
         f"window.ANIM_WINDOW_AFTER_MAX = {ANIM_WINDOW_AFTER_MAX};",
         f"window.ANIM_WORD_COLOR_DEFAULT = {json.dumps(ANIM_WORD_COLOR)};",
@@ -1,5 +1,4 @@
 """Segment rendering and text formatting helpers."""
-import json
 import time
 import unicodedata
 
@@ -8,6 +7,7 @@ from config import (
     REVIEW_SUMMARY_MAX_SEGMENTS,
     SURAH_INFO_PATH,
 )
+from src.core.json_data import load_json
 from src.core.segment_types import SegmentInfo
 from src.alignment.special_segments import ALL_SPECIAL_REFS
 
@@ -95,8 +95,7 @@ def _load_verse_word_counts() -> dict[int, dict[int, int]]:
     if _verse_word_counts_cache is not None:
         return _verse_word_counts_cache
 
-    with open(SURAH_INFO_PATH, 'r', encoding='utf-8') as f:
-        surah_info = json.load(f)
+    surah_info = load_json(SURAH_INFO_PATH)
 
     _verse_word_counts_cache = {}
     for surah_num, data in surah_info.items():